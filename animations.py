@@ -3,9 +3,142 @@ Enhanced Animation Manager Module - UPGRADED
 Implements realistic blood flow with glowing particles, color gradients, and heartbeat deformation
 """
 
+import time
 import vtk
 import numpy as np
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, QObject, QThread, QMetaObject, Qt, pyqtSignal, pyqtSlot
+try:
+    from vtkmodules.util import numpy_support
+    NUMPY_SUPPORT_AVAILABLE = True
+except ImportError:
+    NUMPY_SUPPORT_AVAILABLE = False
+
+# Fragment shader for vtkPointGaussianMapper: shaded sphere-like splats
+SPHERE_SPLAT_SHADER = (
+    "//VTK::Color::Impl\n"
+    "float dist = dot(offsetVCVSOutput.xy, offsetVCVSOutput.xy);\n"
+    "if (dist > 1.0) {\n"
+    "  discard;\n"
+    "} else {\n"
+    "  float scale = (1.0 - dist);\n"
+    "  ambientColor *= scale;\n"
+    "  diffuseColor *= scale;\n"
+    "}\n"
+)
+
+
+class FlowWorker(QObject):
+    """
+    Advances blood particles on a background thread.
+    
+    Each tick integrates progress, gathers positions from the dense path,
+    adds jitter and looks up colors into one of two preallocated buffers,
+    then emits frame_ready with the buffer index. The GUI thread copies the
+    buffer into the VTK arrays and calls release() so it can be reused.
+    """
+    
+    frame_ready = pyqtSignal(int)
+    
+    def __init__(self, dense_path, progress, speed_factors, jitter_buf,
+                 color_lut, pulse_table, pulse_period, base_speed, interval=30):
+        super().__init__()
+        self.dense_path = dense_path
+        self.progress = progress
+        self.speed_factors = speed_factors
+        self.jitter_buf = jitter_buf
+        self.color_lut = color_lut
+        self.pulse_table = pulse_table
+        self.pulse_period = pulse_period  # seconds per heartbeat
+        self.base_speed = base_speed
+        self.interval = interval
+        self.timer = None
+        
+        # Double buffers: the worker never writes what the GUI is reading
+        num_particles = len(progress)
+        self.positions = np.zeros((2, num_particles, 3), dtype=np.float32)
+        self.colors = np.zeros((2, num_particles, 3), dtype=np.uint8)
+        self._in_use = [False, False]
+        # Colors only change when a particle crosses a LUT bucket
+        self._last_bucket = np.full(num_particles, -1, dtype=np.int16)
+        self.colors_changed = [False, False]
+        self._write = 0
+        self._jitter_idx = 0
+        self.heartbeat_phase = 0  # index into the pulse table
+        self._t0 = None
+        self._last_t = None
+    
+    @pyqtSlot()
+    def start(self):
+        """Start the tick timer (runs in the worker thread)"""
+        self._t0 = self._last_t = time.perf_counter()
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(self.interval)
+    
+    @pyqtSlot()
+    def stop(self):
+        """Stop the tick timer (runs in the worker thread)"""
+        if self.timer:
+            self.timer.stop()
+            self.timer = None
+    
+    @pyqtSlot()
+    def tick(self):
+        """Advance all particles one frame"""
+        buf = self._write
+        if self._in_use[buf]:
+            return  # GUI thread has not consumed this buffer yet
+        
+        # Phase and step follow wall-clock time, so timer slips don't
+        # change the heartbeat rate or flow speed
+        now = time.perf_counter()
+        elapsed = now - self._t0
+        frames = min(now - self._last_t, 0.1) / (self.interval / 1000.0)
+        self._last_t = now
+        
+        # Update heartbeat pulse (affects speed) from the precomputed wave
+        table_size = len(self.pulse_table)
+        self.heartbeat_phase = int(elapsed / self.pulse_period * table_size) % table_size
+        current_speed = self.base_speed * self.pulse_table[self.heartbeat_phase]
+        
+        self.progress += current_speed * self.speed_factors * (0.01 * frames)
+        
+        # Loop back to start when reaching end
+        np.mod(self.progress, 1.0, out=self.progress)
+        
+        self.compute(buf)
+        self._in_use[buf] = True
+        self._write = buf ^ 1
+        self.frame_ready.emit(buf)
+    
+    def compute(self, buf, jitter=True):
+        """
+        Fill buffer buf with positions/colors for the current progress.
+        
+        Args:
+            buf: Buffer index (0 or 1)
+            jitter: Add slight random wobble to positions for realism
+        """
+        # Pure gather from the dense path - no per-frame interpolation
+        last = len(self.dense_path) - 1
+        idx = (self.progress * last).astype(np.int32)
+        np.minimum(idx, last, out=idx)  # Guard float rounding at progress ~1.0
+        positions = self.positions[buf]
+        np.take(self.dense_path, idx, axis=0, out=positions)
+        if jitter:
+            positions += self.jitter_buf[self._jitter_idx]
+            self._jitter_idx = (self._jitter_idx + 1) % len(self.jitter_buf)
+        
+        bucket = (self.progress * 255).astype(np.int16)
+        changed = not np.array_equal(bucket, self._last_bucket)
+        if changed:
+            np.take(self.color_lut, bucket, axis=0, out=self.colors[buf])
+            self._last_bucket[:] = bucket
+        self.colors_changed[buf] = changed
+    
+    def release(self, buf):
+        """Mark buffer buf as free for the worker to write again"""
+        self._in_use[buf] = False
 
 
 class AnimationManager:
@@ -17,34 +150,78 @@ class AnimationManager:
         self.organ_type = organ_type
         self.actors = {}
         
-        # Animation timers
-        self.flow_timer = None
-        self.electrical_timer = None
-        self.contraction_timer = None
+        # Animation timers (flow runs on a worker thread)
+        self.flow_thread = None
+        self.flow_worker = None
+        
+        # Set when an update changed something visible; the render timer
+        # renders once per tick only if this is set
+        self.needs_render = False
+        # Long-lived timers: each run starts/stops them instead of making new ones
+        self.electrical_timer = QTimer()
+        self.electrical_timer.timeout.connect(self.update_electrical_animation)
+        self.contraction_timer = QTimer()
+        self.contraction_timer.timeout.connect(self.update_contraction_only)
         
         # ========== ENHANCED BLOOD FLOW PARAMETERS ==========
-        self.flow_particles = []
+        # All blood particles are rendered as ONE splat actor; per-particle
+        # state lives in numpy arrays that back the VTK point/color arrays.
+        self.particle_actor = None
+        self.particle_points = None
+        self.particle_color_array = None
+        self.particle_positions = None  # (N, 3) float32, shared with VTK
+        self.particle_colors = None  # (N, 3) uint8, shared with VTK
+        self.particle_progress = None  # (N,) 0.0 to 1.0 along path
+        self.particle_speed_factors = None
+        # Trails: ONE polyline actor, (N, TRAIL_LEN, 3) buffer shared with VTK
+        self.trail_actor = None
+        self.trail_points = None
+        self.trail_color_array = None
+        self._trail_buf = None
+        self._trail_colors = None
+        self.path_arr = None  # (P, 3) float32 flow path
+        self.dense_path = None  # path resampled evenly by arclength
         self.flow_path_points = []
-        self.particle_speed = 2.0
+        self.vessel_actors = []
+        self.entry_exit_markers = []
         
         # Blood appearance configuration
         self.NUM_PARTICLES = 50  # Number of blood particles (reduced for visibility)
         self.PARTICLE_RADIUS = 1.5  # Size of each drop (MUCH LARGER)
         self.TUBE_RADIUS = 2.0  # Width of blood stream tube (MUCH LARGER)
         self.USE_GLOW = True  # Enable glow effect 
+        self.SHOW_TRAILS = True  # Fading trail behind each particle
+        self.TRAIL_LEN = 8  # Trail vertices per particle
+        self.DENSE_PATH_SIZE = 1024  # Resampled path points for per-frame lookup
+        self._color_lut = self._build_blood_color_lut()
+        self._color_lut_u8 = (self._color_lut * 255).astype(np.uint8)
         # Heartbeat pulse parameters
-        self.heartbeat_phase = 0.0
-        self.heartbeat_frequency = 1.2  # seconds per beat
+        self.heartbeat_frequency = 1.2  # seconds per beat (pulse and contraction)
+        self._pulse_table = None
         self.base_speed = 2.0
         
         # ========== HEART DEFORMATION ==========
-        self.deformation_phase = 0
+        self.deformation_phase = 0  # frame index into the deformation table
+        self._def_table = None
+        self._def_t0 = 0.0
         self.deformation_parts = []
+        # Deformation state as arrays (one row per deforming part)
+        self._def_actors = []
+        self._def_amp = None
+        self._def_base_scale = None
+        self._def_base_pos = []
         self.original_scales = {}
         self.original_positions = {}  # Store original positions
         
-        # Electrical animation
-        self.electrical_particles = []
+        # Shared sphere tessellations, keyed by (radius, resolution)
+        self._sphere_templates = {}
+        
+        # Electrical animation (ONE glyph actor, single color)
+        self.electrical_actor = None
+        self.electrical_points = None
+        self._elec_path_arr = None
+        self._elec_idx = None
+        self._elec_positions = None  # (8, 3) float32, shared with VTK
         self.electrical_index = 0
     
     def set_manual_flow_path(self, path_points):
@@ -79,22 +256,6 @@ class AnimationManager:
     
     # ========== ENHANCED BLOOD FLOW WITH GLOWING PARTICLES ==========
     
-    def set_manual_flow_path(self, path_points):
-        """
-        Set a custom path for blood flow particles.
-        This allows integration with the manual point-picking system.
-        
-        Args:
-            path_points: List of (x, y, z) tuples defining the flow path
-        """
-        if len(path_points) >= 2:
-            self.flow_path_points = path_points
-            print(f"âœ“ Custom flow path set with {len(path_points)} points")
-            return True
-        else:
-            print("âœ— Need at least 2 points for flow path")
-            return False
-    
     def start_flow_animation(self, flow_type=None, speed=5, use_manual_path=False):
         """
         Start blood flow animation with optional manual path support.
@@ -108,7 +269,6 @@ class AnimationManager:
         
         # Map speed (1-10) to actual particle speed
         self.base_speed = speed * 0.4  # Scale factor
-        self.particle_speed = self.base_speed
         
         
         # Determine flow path
@@ -120,11 +280,16 @@ class AnimationManager:
             # Create automatic path based on organ and flow type
             path_points = self.create_flow_path(flow_type)
 
-        if not path_points or len(path_points) < 2:
+        if path_points is None or len(path_points) < 2:
             print("Failed to create flow path")
             return False
         self.create_entry_exit_markers(path_points)
         
+        # Precompute one full pulse period, indexed by elapsed time
+        # Creates "ba-bump" effect every ~1.2 seconds
+        self._pulse_table = (
+            1.0 + 0.3 * np.sin(2 * np.pi * np.arange(256) / 256)
+        ).astype(np.float32)
         
         # Create glowing blood particles along the path
         self.create_glowing_blood_particles(path_points)
@@ -136,17 +301,36 @@ class AnimationManager:
         if self.organ_type == 'heart':
             self.setup_heart_deformation()
         
-        # Reset heartbeat phase
-        self.heartbeat_phase = 0.0
-        
-        # Start animation timer
-        self.flow_timer = QTimer()
-        self.flow_timer.timeout.connect(self.update_flow_animation)
-        interval = 30  # ~33 FPS for smooth animation
-        self.flow_timer.start(interval)
+        # Start particle worker thread; frames come back as queued signals
+        self.flow_thread = QThread()
+        self.flow_worker.moveToThread(self.flow_thread)
+        self.flow_worker.frame_ready.connect(
+            self.update_flow_animation, Qt.QueuedConnection
+        )
+        self.flow_thread.started.connect(self.flow_worker.start)
+        self.flow_thread.start()
         
         return True
     
+    def _get_sphere_template(self, radius, resolution):
+        """
+        Get a shared sphere polydata, tessellating it only once.
+        Actors using it are placed with SetPosition instead of SetCenter.
+        
+        Args:
+            radius: Sphere radius
+            resolution: Theta/phi resolution
+        """
+        key = (radius, resolution)
+        if key not in self._sphere_templates:
+            sphere = vtk.vtkSphereSource()
+            sphere.SetRadius(radius)
+            sphere.SetThetaResolution(resolution)
+            sphere.SetPhiResolution(resolution)
+            sphere.Update()
+            self._sphere_templates[key] = sphere.GetOutput()
+        return self._sphere_templates[key]
+    
     def create_entry_exit_markers(self, path_points):
         """
         Create visible markers at entry and exit points of the blood flow path.
@@ -156,40 +340,28 @@ class AnimationManager:
         """
         # Entry point marker (GREEN sphere)
         entry_point = path_points[0]
-        entry_sphere = vtk.vtkSphereSource()
-        entry_sphere.SetCenter(entry_point)
-        entry_sphere.SetRadius(2.5)  # Large and visible
-        entry_sphere.SetThetaResolution(32)
-        entry_sphere.SetPhiResolution(32)
-        
         entry_mapper = vtk.vtkPolyDataMapper()
-        entry_mapper.SetInputConnection(entry_sphere.GetOutputPort())
+        entry_mapper.SetInputData(self._get_sphere_template(2.5, 32))  # Large and visible
         
         entry_actor = vtk.vtkActor()
         entry_actor.SetMapper(entry_mapper)
+        entry_actor.SetPosition(entry_point)
         entry_actor.GetProperty().SetColor(0.0, 1.0, 0.0)  # Bright green
         entry_actor.GetProperty().SetOpacity(0.8)
         
         self.renderer.AddActor(entry_actor)
         
         # Store for cleanup
-        if not hasattr(self, 'entry_exit_markers'):
-            self.entry_exit_markers = []
         self.entry_exit_markers.append(entry_actor)
         
         # Exit point marker (RED sphere)
         exit_point = path_points[-1]
-        exit_sphere = vtk.vtkSphereSource()
-        exit_sphere.SetCenter(exit_point)
-        exit_sphere.SetRadius(2.5)  # Large and visible
-        exit_sphere.SetThetaResolution(32)
-        exit_sphere.SetPhiResolution(32)
-        
         exit_mapper = vtk.vtkPolyDataMapper()
-        exit_mapper.SetInputConnection(exit_sphere.GetOutputPort())
+        exit_mapper.SetInputData(self._get_sphere_template(2.5, 32))  # Large and visible
         
         exit_actor = vtk.vtkActor()
         exit_actor.SetMapper(exit_mapper)
+        exit_actor.SetPosition(exit_point)
         exit_actor.GetProperty().SetColor(1.0, 0.0, 0.0)  # Bright red
         exit_actor.GetProperty().SetOpacity(0.8)
         
@@ -202,105 +374,257 @@ class AnimationManager:
    
     def create_glowing_blood_particles(self, path_points):
         """
-        Create realistic glowing blood particles with trails and color gradients.
+        Create realistic glowing blood particles with color gradients.
+        
+        All particles are points of ONE vtkPolyData rendered through a
+        vtkPointGaussianMapper sphere splat, so the whole stream is a single actor
+        (one draw call). Positions and colors live in numpy buffers that
+        back the VTK arrays; each frame writes the buffers and calls Modified().
         
         Args:
             path_points: List of (x, y, z) coordinates defining the path
         """
-        self.flow_particles = []
+        num_particles = self.NUM_PARTICLES
+        self.path_arr = np.ascontiguousarray(path_points, dtype=np.float32)
+        self.dense_path = self._resample_path(self.path_arr, self.DENSE_PATH_SIZE)
         
-        # Distribute particles evenly along path
-        for i in range(self.NUM_PARTICLES):
-            # Create sphere for blood drop (LARGER and SMOOTHER)
-            sphere = vtk.vtkSphereSource()
-            sphere.SetRadius(self.PARTICLE_RADIUS)
-            sphere.SetThetaResolution(32)  # More detail
-            sphere.SetPhiResolution(32)  # More detail
-            # Create mapper
-            mapper = vtk.vtkPolyDataMapper()
-            mapper.SetInputConnection(sphere.GetOutputPort())
-            
-            # Create actor
-            actor = vtk.vtkActor()
-            actor.SetMapper(mapper)
-            
-            # Calculate initial position along path (evenly distributed)
-            initial_progress = i / self.NUM_PARTICLES
-            
-            if i == 0:
-                path_length = len(path_points)
-                idx = int(initial_progress * (path_length - 1))
-                pos = path_points[idx]
-                print(f"  First particle at: {pos} (progress: {initial_progress})")
-            
-            # Set initial color based on position (gradient along path)
-            color = self.get_blood_color(initial_progress)
-            actor.GetProperty().SetColor(color)
-            
-            # Enable glow/shine effect (ENHANCED VISIBILITY)
-            if self.USE_GLOW:
-                actor.GetProperty().SetSpecular(0.9)  # Very high shine
-                actor.GetProperty().SetSpecularPower(100)  # Sharp highlight
-                actor.GetProperty().SetOpacity(1.0)  # FULLY OPAQUE for visibility
-            else:
-                actor.GetProperty().SetSpecular(0.5)
-                actor.GetProperty().SetSpecularPower(30)
-                actor.GetProperty().SetOpacity(1.0)  # FULLY OPAQUE
-            
-            # Add slight randomness to speed for realism
-            speed_variation = np.random.uniform(0.85, 1.15)
-            
-            # Store particle data
-            particle_data = {
-                'actor': actor,
-                'path': path_points,
-                'progress': initial_progress,  # 0.0 to 1.0 along path
-                'speed_factor': speed_variation,
-                'trail_actors': []  # For motion trails
-            }
-            
-            self.flow_particles.append(particle_data)
-            self.renderer.AddActor(actor)
+        # Particle state (evenly distributed along path, slight speed randomness)
+        self.particle_progress = np.linspace(0.0, 1.0, num_particles, endpoint=False)
+        self.particle_speed_factors = np.random.uniform(0.85, 1.15, num_particles)
+        
+        # Jitter is drawn once and replayed cyclically (256 frames)
+        jitter_buf = np.random.normal(
+            0, 0.02, (256, num_particles, 3)
+        ).astype(np.float32)
+        
+        interval = 30  # ~33 FPS for smooth animation
+        self.flow_worker = FlowWorker(
+            self.dense_path, self.particle_progress, self.particle_speed_factors,
+            jitter_buf, self._color_lut_u8, self._pulse_table,
+            self.heartbeat_frequency, self.base_speed, interval
+        )
+        
+        # Buffers shared with VTK (must always be written in place)
+        self.flow_worker.compute(0, jitter=False)
+        self.particle_positions = self.flow_worker.positions[0].copy()
+        self.particle_colors = self.flow_worker.colors[0].copy()
+        
+        print(f"  First particle at: {tuple(self.particle_positions[0])} (progress: 0.0)")
+        
+        self.particle_points = vtk.vtkPoints()
+        if NUMPY_SUPPORT_AVAILABLE:
+            self.particle_points.SetData(
+                numpy_support.numpy_to_vtk(self.particle_positions, deep=False)
+            )
+            self.particle_color_array = numpy_support.numpy_to_vtk(
+                self.particle_colors, deep=False, array_type=vtk.VTK_UNSIGNED_CHAR
+            )
+        else:
+            self.particle_points.SetNumberOfPoints(num_particles)
+            self.particle_color_array = vtk.vtkUnsignedCharArray()
+            self.particle_color_array.SetNumberOfComponents(3)
+            self.particle_color_array.SetNumberOfTuples(num_particles)
+        self.particle_color_array.SetName("colors")
+        
+        particle_polydata = vtk.vtkPolyData()
+        particle_polydata.SetPoints(self.particle_points)
+        particle_polydata.GetPointData().SetScalars(self.particle_color_array)
+        self._push_particle_buffers()
+        
+        # Each point is a screen-space quad shaded as a sphere (no geometry)
+        mapper = vtk.vtkPointGaussianMapper()
+        mapper.SetInputData(particle_polydata)
+        mapper.SetScaleFactor(self.PARTICLE_RADIUS)
+        mapper.SetSplatShaderCode(SPHERE_SPLAT_SHADER)
+        mapper.EmissiveOff()
+        
+        self.particle_actor = vtk.vtkActor()
+        self.particle_actor.SetMapper(mapper)
+        
+        # Enable glow/shine effect (ENHANCED VISIBILITY)
+        if self.USE_GLOW:
+            self.particle_actor.GetProperty().SetSpecular(0.9)  # Very high shine
+            self.particle_actor.GetProperty().SetSpecularPower(100)  # Sharp highlight
+            self.particle_actor.GetProperty().SetOpacity(1.0)  # FULLY OPAQUE for visibility
+        else:
+            self.particle_actor.GetProperty().SetSpecular(0.5)
+            self.particle_actor.GetProperty().SetSpecularPower(30)
+            self.particle_actor.GetProperty().SetOpacity(1.0)  # FULLY OPAQUE
+        
+        self.renderer.AddActor(self.particle_actor)
+        
+        if self.SHOW_TRAILS:
+            self.create_particle_trails()
+        
+        print(f"âœ“ Created {num_particles} glowing blood particles")
+    
+    def create_particle_trails(self):
+        """
+        Create fading trails behind the blood particles.
+        
+        All trails are polylines of one vtkPolyData (one actor), backed by
+        a (NUM_PARTICLES, TRAIL_LEN, 3) buffer that is shifted every frame.
+        Vertex colors fade from the particle color to transparent.
+        """
+        num_particles = self.NUM_PARTICLES
+        trail_len = self.TRAIL_LEN
+        num_points = num_particles * trail_len
+        
+        # Start with every trail collapsed onto its particle
+        self._trail_buf = np.repeat(self.particle_positions[:, None, :], trail_len, axis=1)
+        self._trail_colors = np.zeros((num_particles, trail_len, 4), dtype=np.uint8)
+        self._trail_colors[:, :, 3] = np.linspace(255, 0, trail_len).astype(np.uint8)
+        
+        # A jump longer than a quarter of the path means the particle wrapped
+        path_length = np.linalg.norm(np.diff(self.dense_path, axis=0), axis=1).sum()
+        self._trail_reset_dist = 0.25 * path_length
+        
+        self.trail_points = vtk.vtkPoints()
+        if NUMPY_SUPPORT_AVAILABLE:
+            self.trail_points.SetData(
+                numpy_support.numpy_to_vtk(self._trail_buf.reshape(-1, 3), deep=False)
+            )
+            self.trail_color_array = numpy_support.numpy_to_vtk(
+                self._trail_colors.reshape(-1, 4), deep=False,
+                array_type=vtk.VTK_UNSIGNED_CHAR
+            )
+        else:
+            self.trail_points.SetNumberOfPoints(num_points)
+            self.trail_color_array = vtk.vtkUnsignedCharArray()
+            self.trail_color_array.SetNumberOfComponents(4)
+            self.trail_color_array.SetNumberOfTuples(num_points)
+        self.trail_color_array.SetName("trail_colors")
+        
+        # Connectivity never changes - build it once
+        lines = vtk.vtkCellArray()
+        for i in range(num_particles):
+            lines.InsertNextCell(trail_len)
+            for j in range(trail_len):
+                lines.InsertCellPoint(i * trail_len + j)
+        
+        trail_polydata = vtk.vtkPolyData()
+        trail_polydata.SetPoints(self.trail_points)
+        trail_polydata.SetLines(lines)
+        trail_polydata.GetPointData().SetScalars(self.trail_color_array)
+        
+        mapper = vtk.vtkPolyDataMapper()
+        mapper.SetInputData(trail_polydata)
+        mapper.SetColorModeToDirectScalars()
+        mapper.ScalarVisibilityOn()
+        
+        self.trail_actor = vtk.vtkActor()
+        self.trail_actor.SetMapper(mapper)
+        self.trail_actor.GetProperty().SetLineWidth(3)
+        self.trail_actor.GetProperty().SetLighting(False)
+        
+        self._update_trails()
+        self.renderer.AddActor(self.trail_actor)
+    
+    def _update_trails(self, colors_changed=True):
+        """
+        Shift trail history by one frame and append current positions.
+        
+        Args:
+            colors_changed: Particle colors changed since the last frame
+        """
+        trail = self._trail_buf
+        
+        # Collapse trails of particles that wrapped back to the path start
+        jump = np.linalg.norm(self.particle_positions - trail[:, 0], axis=1)
+        wrapped = jump > self._trail_reset_dist
         
-        print(f"âœ“ Created {self.NUM_PARTICLES} glowing blood particles")
+        trail[:, 1:] = trail[:, :-1]
+        trail[:, 0] = self.particle_positions
+        if wrapped.any():
+            trail[wrapped] = self.particle_positions[wrapped, None, :]
+        
+        if colors_changed:
+            self._trail_colors[:, :, :3] = self.particle_colors[:, None, :]
     
-    def get_blood_color(self, progress):
+    def _resample_path(self, path_arr, num_samples):
         """
-        Get blood color based on progress along path.
+        Resample a path evenly along its arclength (linear interpolation).
+        
+        Args:
+            path_arr: (P, 3) array of path points
+            num_samples: Number of points in the resampled path
+        
+        Returns:
+            (num_samples, 3) float32 array
+        """
+        seg_lengths = np.linalg.norm(np.diff(path_arr, axis=0), axis=1)
+        cum = np.concatenate([[0.0], np.cumsum(seg_lengths)])
+        if cum[-1] <= 0:
+            return np.repeat(path_arr[:1], num_samples, axis=0).astype(np.float32)
+        
+        s = np.linspace(0.0, cum[-1], num_samples)
+        dense = np.stack([np.interp(s, cum, path_arr[:, k]) for k in range(3)], axis=1)
+        return dense.astype(np.float32)
+    
+    def _push_particle_buffers(self, colors_changed=True):
+        """
+        Notify VTK that the particle position/color buffers changed.
+        
+        Args:
+            colors_changed: Also invalidate the color arrays
+        """
+        if not NUMPY_SUPPORT_AVAILABLE:
+            # Buffers are not shared with VTK - copy values over
+            for i in range(self.NUM_PARTICLES):
+                self.particle_points.SetPoint(i, self.particle_positions[i])
+                if colors_changed:
+                    self.particle_color_array.SetTuple3(i, *self.particle_colors[i])
+            if self.trail_actor is not None:
+                flat_points = self._trail_buf.reshape(-1, 3)
+                flat_colors = self._trail_colors.reshape(-1, 4)
+                for i in range(len(flat_points)):
+                    self.trail_points.SetPoint(i, flat_points[i])
+                    if colors_changed:
+                        self.trail_color_array.SetTuple4(i, *flat_colors[i])
+        self.particle_points.Modified()
+        if self.trail_actor is not None:
+            self.trail_points.Modified()
+        if colors_changed:
+            self.particle_color_array.Modified()
+            if self.trail_actor is not None:
+                self.trail_color_array.Modified()
+    
+    def _build_blood_color_lut(self, size=256):
+        """
+        Precompute the blood color gradient as a lookup table.
         Creates gradient: Deep Crimson â†’ Red â†’ Orange â†’ Yellow
         
         Args:
-            progress: 0.0 to 1.0 representing position along path
+            size: Number of entries sampled over progress 0.0 to 1.0
         
         Returns:
-            (r, g, b) tuple
+            (size, 3) float32 array of (r, g, b)
         """
         # Color stops along gradient
         # 0.0: Deep Crimson (dark red)
         # 0.4: Bright Red
         # 0.7: Orange-Red
         # 1.0: Yellow-Orange (oxygenated)
-        
-        if progress < 0.4:
-            # Deep crimson â†’ Bright red
-            t = progress / 0.4
-            r = 0.6 + (0.4 * t)  # 0.6 â†’ 1.0
-            g = 0.0 + (0.1 * t)  # 0.0 â†’ 0.1
-            b = 0.0 + (0.1 * t)  # 0.0 â†’ 0.1
-        elif progress < 0.7:
-            # Bright red â†’ Orange
-            t = (progress - 0.4) / 0.3
-            r = 1.0  # Keep red high
-            g = 0.1 + (0.4 * t)  # 0.1 â†’ 0.5
-            b = 0.1 * (1 - t)  # 0.1 â†’ 0.0
-        else:
-            # Orange â†’ Yellow (oxygenated blood)
-            t = (progress - 0.7) / 0.3
-            r = 1.0  # Keep red high
-            g = 0.5 + (0.4 * t)  # 0.5 â†’ 0.9
-            b = 0.0 + (0.2 * t)  # 0.0 â†’ 0.2
-        
-        return (r, g, b)
+        progress = np.linspace(0.0, 1.0, size)
+        lut = np.empty((size, 3), dtype=np.float32)
+        
+        # Deep crimson â†’ Bright red
+        t = progress / 0.4
+        low = np.stack([0.6 + 0.4 * t, 0.1 * t, 0.1 * t], axis=1)
+        
+        # Bright red â†’ Orange
+        t = (progress - 0.4) / 0.3
+        mid = np.stack([np.ones_like(t), 0.1 + 0.4 * t, 0.1 * (1 - t)], axis=1)
+        
+        # Orange â†’ Yellow (oxygenated blood)
+        t = (progress - 0.7) / 0.3
+        high = np.stack([np.ones_like(t), 0.5 + 0.4 * t, 0.2 * t], axis=1)
+        
+        lut[:] = np.where(
+            (progress < 0.4)[:, None], low,
+            np.where((progress < 0.7)[:, None], mid, high)
+        )
+        return lut
     
     def create_blood_vessel_tube(self, path_points):
         """
@@ -309,10 +633,11 @@ class AnimationManager:
         Args:
             path_points: List of (x, y, z) coordinates
         """
-        # Create points
+        # Create points (preallocated, filled by index)
         points = vtk.vtkPoints()
-        for point in path_points:
-            points.InsertNextPoint(point)
+        points.SetNumberOfPoints(len(path_points))
+        for i, point in enumerate(path_points):
+            points.SetPoint(i, point)
         
         # Create polyline
         polyline = vtk.vtkPolyLine()
@@ -333,7 +658,6 @@ class AnimationManager:
         tube.SetRadius(self.TUBE_RADIUS)
         tube.SetNumberOfSides(20)
         tube.CappingOn()
-        tube.Update()
         
         # Create mapper
         mapper = vtk.vtkPolyDataMapper()
@@ -348,71 +672,29 @@ class AnimationManager:
         self.renderer.AddActor(vessel_actor)
         
         # Store for cleanup
-        if not hasattr(self, 'vessel_actors'):
-            self.vessel_actors = []
         self.vessel_actors.append(vessel_actor)
     
-    def update_flow_animation(self):
-        """
-        Update particle positions with heartbeat pulse and color gradient.
+    def update_flow_animation(self, buf):
         """
-        # ADD THIS DEBUG LINE:
-        # Uncomment to debug particle positions
-        if len(self.flow_particles) > 0 and hasattr(self, 'debug_counter'):
-            if self.debug_counter % 30 == 0:  # Print every 30 frames
-                p = self.flow_particles[0]
-                pos = p['actor'].GetPosition()
-                print(f"Particle 0 at: {pos}, progress: {p['progress']:.2f}")
-            self.debug_counter += 1
-        else:
-            self.debug_counter = 0
+        Upload a particle frame prepared by the flow worker (GUI thread).
         
-        # Update heartbeat pulse (affects speed)
-        self.heartbeat_phase += 0.05  # Increment phase
-        
-        # Calculate pulse factor using sine wave
-        # Creates "ba-bump" effect every ~1.2 seconds
-        pulse = 1.0 + 0.3 * np.sin(self.heartbeat_phase * np.pi / (self.heartbeat_frequency * 60))
-        current_speed = self.base_speed * pulse
-        
-        # Update blood particles
-        for particle in self.flow_particles:
-            path = particle['path']
-            if not path:
-                continue
-            
-            # Calculate movement speed
-            speed = current_speed * particle['speed_factor'] * 0.01
-            
-            # Update progress along path (0.0 to 1.0)
-            particle['progress'] += speed
-            
-            # Loop back to start when reaching end
-            if particle['progress'] >= 1.0:
-                particle['progress'] = particle['progress'] % 1.0
-            
-            # Calculate position with smooth interpolation
-            path_length = len(path)
-            float_index = particle['progress'] * (path_length - 1)
-            idx = int(float_index)
-            next_idx = (idx + 1) % path_length
-            fraction = float_index - idx
-            
-            # Interpolate position
-            current_pos = np.array(path[idx])
-            next_pos = np.array(path[next_idx])
-            interpolated_pos = current_pos * (1 - fraction) + next_pos * fraction
-            
-            # Add slight random jitter for realism (small wobble)
-            jitter = np.random.normal(0, 0.02, 3)
-            final_pos = interpolated_pos + jitter
-            
-            # Update particle position
-            particle['actor'].SetPosition(tuple(final_pos))
-            
-            # Update color based on progress
-            color = self.get_blood_color(particle['progress'])
-            particle['actor'].GetProperty().SetColor(color)
+        Args:
+            buf: Index of the worker buffer holding the new frame
+        """
+        worker = self.flow_worker
+        if worker is None or self.particle_actor is None:
+            return  # Late frame after stop
+        
+        # Copy into the VTK-backed buffers, then hand the buffer back
+        np.copyto(self.particle_positions, worker.positions[buf])
+        colors_changed = worker.colors_changed[buf]
+        if colors_changed:
+            np.copyto(self.particle_colors, worker.colors[buf])
+        worker.release(buf)
+        if self.trail_actor is not None:
+            self._update_trails(colors_changed)
+        self._push_particle_buffers(colors_changed)
+        self.needs_render = True
         
         # Update heart deformation (SIZE CHANGE ONLY)
         if self.organ_type == 'heart' and self.deformation_parts:
@@ -433,90 +715,78 @@ class AnimationManager:
             return self.create_muscle_flow_path(flow_type)
         elif self.organ_type == 'teeth':
             return self.create_dental_flow_path(flow_type)
-        return []
+        return np.empty((0, 3), dtype=np.float32)
+    
+    def _stack_path(self, x, y, z):
+        """
+        Combine per-axis coordinates into a (N, 3) float32 path array.
+        Scalars are broadcast against the array coordinates.
+        """
+        x, y, z = np.broadcast_arrays(x, y, z)
+        return np.stack([x, y, z], axis=1).astype(np.float32)
+    
+    def _path_params(self, num_points):
+        """Sample parameter t in [0, 1) for a path of num_points points"""
+        return np.linspace(0.0, 1.0, num_points, endpoint=False)
     
     def create_heart_flow_path(self, flow_type):
         """Create heart-specific flow paths"""
-        points = []
-        
         if flow_type and 'Aorta' in flow_type:
             # Aorta flow path (ascending then descending)
-            for i in range(80):
-                t = i / 80.0
-                x = -1.5 - t * 0.8 * np.sin(t * np.pi)
-                y = -1.0 + t * 7.0
-                z = t * 1.8 * np.cos(t * np.pi * 0.5)
-                points.append((x, y, z))
+            t = self._path_params(80)
+            x = -1.5 - t * 0.8 * np.sin(t * np.pi)
+            y = -1.0 + t * 7.0
+            z = t * 1.8 * np.cos(t * np.pi * 0.5)
         
         elif flow_type and 'Pulmonary' in flow_type:
-            for i in range(60):
-                t = i / 60.0
-                x = 1.5 + t * 0.5
-                y = 1.0 + t * 4.0
-                z = np.cos(t * np.pi) * 0.4
-                points.append((x, y, z))
+            t = self._path_params(60)
+            x = 1.5 + t * 0.5
+            y = 1.0 + t * 4.0
+            z = np.cos(t * np.pi) * 0.4
         
         elif flow_type and 'Coronary' in flow_type:
-            for i in range(70):
-                t = i / 70.0
-                angle = t * 2 * np.pi
-                x = -1.5 + 2.5 * np.cos(angle)
-                y = -1.0 + 2.5 * np.sin(angle)
-                z = t * 0.8
-                points.append((x, y, z))
+            t = self._path_params(70)
+            angle = t * 2 * np.pi
+            x = -1.5 + 2.5 * np.cos(angle)
+            y = -1.0 + 2.5 * np.sin(angle)
+            z = t * 0.8
         
         else:
             # Default circular flow
-            for i in range(60):
-                t = i / 60.0
-                angle = t * 2 * np.pi
-                x = 2.5 * np.cos(angle)
-                y = 2.5 * np.sin(angle)
-                z = np.sin(t * np.pi * 2) * 0.5
-                points.append((x, y, z))
+            t = self._path_params(60)
+            angle = t * 2 * np.pi
+            x = 2.5 * np.cos(angle)
+            y = 2.5 * np.sin(angle)
+            z = np.sin(t * np.pi * 2) * 0.5
         
-        return points
+        return self._stack_path(x, y, z)
     
     def create_brain_flow_path(self, flow_type):
         """Create brain cerebral artery flow"""
-        points = []
-        for i in range(70):
-            t = i / 70.0
-            angle = t * np.pi
-            x = 3.5 * np.cos(angle)
-            y = 1 + t * 2.5
-            z = 3.5 * np.sin(angle)
-            points.append((x, y, z))
-        return points
+        t = self._path_params(70)
+        angle = t * np.pi
+        return self._stack_path(3.5 * np.cos(angle), 1 + t * 2.5, 3.5 * np.sin(angle))
     
     def create_muscle_flow_path(self, flow_type):
         """Create muscle tissue perfusion flow"""
-        points = []
-        for i in range(60):
-            t = i / 60.0
-            x = -2 + t * 4.5
-            y = 2 - t * 4.5
-            z = np.sin(t * np.pi * 3) * 0.3
-            points.append((x, y, z))
-        return points
+        t = self._path_params(60)
+        return self._stack_path(-2 + t * 4.5, 2 - t * 4.5, np.sin(t * np.pi * 3) * 0.3)
     
     def create_dental_flow_path(self, flow_type):
         """Create dental pulp blood flow"""
-        points = []
-        for i in range(50):
-            t = i / 50.0
-            angle = t * np.pi * 2
-            x = 2.8 * np.cos(angle)
-            y = 0.2
-            z = 2.8 * np.sin(angle)
-            points.append((x, y, z))
-        return points
+        t = self._path_params(50)
+        angle = t * np.pi * 2
+        return self._stack_path(2.8 * np.cos(angle), 0.2, 2.8 * np.sin(angle))
     
     # ========== HEART DEFORMATION (SIZE-BASED, NOT MOVEMENT) ==========
     
     def setup_heart_deformation(self):
         """Identify heart parts that should deform (pump)"""
-        self.deformation_parts = []
+        self.deformation_parts = []  # names of deforming parts
+        self._def_actors = []
+        self._def_base_pos = []
+        amplitudes = []
+        base_scales = []
         
         # Keywords for parts that should pump
         pump_keywords = [
@@ -532,78 +802,93 @@ class AnimationManager:
             # Check if this part should pump
             for keyword in pump_keywords:
                 if keyword in part_lower:
-                    self.deformation_parts.append({
-                        'name': part_name,
-                        'actor': actor,
-                        'base_scale': self.original_scales.get(part_name, (1, 1, 1)),
-                        'base_position': self.original_positions.get(part_name, (0, 0, 0)),
-                        'amplitude': 0.15 if 'ventricle' in part_lower else 0.10
-                    })
+                    self.deformation_parts.append(part_name)
+                    self._def_actors.append(actor)
+                    self._def_base_pos.append(
+                        tuple(self.original_positions.get(part_name, (0, 0, 0)))
+                    )
+                    base_scales.append(self.original_scales.get(part_name, (1, 1, 1)))
+                    amplitudes.append(0.15 if 'ventricle' in part_lower else 0.10)
                     break
         
+        self._def_amp = np.array(amplitudes, dtype=np.float32)
+        self._def_base_scale = np.array(base_scales, dtype=np.float32).reshape(-1, 3)
+        
+        # Precompute one heartbeat cycle, indexed by elapsed time
+        # Systole (contraction): scale < 1.0
+        # Diastole (relaxation): scale > 1.0
+        self._def_table = (
+            1.0 + 0.12 * np.sin(2 * np.pi * np.arange(256) / 256)
+        ).astype(np.float32)
+        
         print(f"âœ“ Heart deformation enabled for {len(self.deformation_parts)} parts")
         self.deformation_phase = 0
+        self._def_t0 = time.perf_counter()
     
     def update_heart_deformation(self):
         """
         Update heart pumping deformation - SIZE CHANGE ONLY.
         The position stays fixed; only the scale changes to simulate contraction/expansion.
         """
-        # Increment phase (heartbeat cycle)
-        self.deformation_phase += 0.08  # ~75 BPM at 30ms timer
-        
-        # Calculate scale factor using sine wave
-        # Systole (contraction): scale < 1.0
-        # Diastole (relaxation): scale > 1.0
-        scale_multiplier = 1.0 + 0.12 * np.sin(self.deformation_phase)
+        # Phase of the heartbeat cycle from elapsed time (one beat per heartbeat_frequency)
+        elapsed = time.perf_counter() - self._def_t0
+        table_size = len(self._def_table)
+        phase = int(elapsed / self.heartbeat_frequency * table_size) % table_size
+        if phase == self.deformation_phase:
+            return  # Same table sample - scales would not change
+        self.deformation_phase = phase
+        self.needs_render = True
+        scale_multiplier = self._def_table[self.deformation_phase]
+        
+        # Calculate new scales for all parts at once (pulsating SIZE)
+        k = 1.0 + self._def_amp * (scale_multiplier - 1.0)
+        new_scales = self._def_base_scale * k[:, None]
         
         # Apply deformation to each heart part
-        for part_data in self.deformation_parts:
-            actor = part_data['actor']
-            base_scale = part_data['base_scale']
-            base_position = part_data['base_position']
-            amplitude = part_data['amplitude']
-            
-            # Calculate new scale (pulsating SIZE)
-            new_scale = (
-                base_scale[0] * (1.0 + amplitude * (scale_multiplier - 1.0)),
-                base_scale[1] * (1.0 + amplitude * (scale_multiplier - 1.0)),
-                base_scale[2] * (1.0 + amplitude * (scale_multiplier - 1.0))
-            )
-            
-            # Apply scale change
-            actor.SetScale(new_scale)
+        for i, actor in enumerate(self._def_actors):
+            actor.SetScale(*new_scales[i])
             
             # CRITICAL: Keep position fixed (don't move the heart parts)
-            actor.SetPosition(base_position)
+            base_position = self._def_base_pos[i]
+            if actor.GetPosition() != base_position:
+                actor.SetPosition(base_position)
     
     def stop_flow_animation(self):
         """Stop flow animation and reset deformation"""
-        if self.flow_timer:
-            self.flow_timer.stop()
-            self.flow_timer = None
+        if self.flow_thread:
+            QMetaObject.invokeMethod(self.flow_worker, "stop", Qt.BlockingQueuedConnection)
+            self.flow_thread.quit()
+            self.flow_thread.wait()
+            self.flow_thread = None
+        self.flow_worker = None
         
         # Remove particles
-        for particle in self.flow_particles:
-            self.renderer.RemoveActor(particle['actor'])
-        self.flow_particles = []
+        if self.particle_actor is not None:
+            self.renderer.RemoveActor(self.particle_actor)
+        self.particle_actor = None
+        self.particle_points = None
+        if self.trail_actor is not None:
+            self.renderer.RemoveActor(self.trail_actor)
+        self.trail_actor = None
+        self.trail_points = None
+        self.trail_color_array = None
+        self.particle_color_array = None
+        self.path_arr = None
+        self.dense_path = None
         
         # Remove vessel tubes
-        if hasattr(self, 'vessel_actors'):
-            for actor in self.vessel_actors:
-                self.renderer.RemoveActor(actor)
-            self.vessel_actors = []
-        if hasattr(self, 'entry_exit_markers'):
-            for actor in self.entry_exit_markers:
-                self.renderer.RemoveActor(actor)
-            self.entry_exit_markers = []
+        for actor in self.vessel_actors:
+            self.renderer.RemoveActor(actor)
+        self.vessel_actors.clear()
+        for actor in self.entry_exit_markers:
+            self.renderer.RemoveActor(actor)
+        self.entry_exit_markers.clear()
         
         
         # Reset heart deformation
         self.reset_deformation()
         
         self.deformation_phase = 0
-        self.heartbeat_phase = 0.0
     
     def reset_deformation(self):
         """Reset all actors to original scales AND positions"""
@@ -621,92 +906,98 @@ class AnimationManager:
         
         self.create_electrical_particles()
         
-        self.electrical_timer = QTimer()
-        self.electrical_timer.timeout.connect(self.update_electrical_animation)
         interval = max(20, int(100 / speed))
         self.electrical_timer.start(interval)
         
         return True
     
     def create_electrical_particles(self):
-        """Create particles for electrical signal"""
-        self.electrical_particles = []
-        
-        path_points = self.create_electrical_path()
+        """
+        Create particles for electrical signal.
+        All particles are points of one polydata instanced with a small
+        sphere glyph; they share one color so only positions are updated.
+        """
+        self._elec_path_arr = self.create_electrical_path()
+        path_length = len(self._elec_path_arr)
         
         num_particles = 8
-        for i in range(num_particles):
-            sphere = vtk.vtkSphereSource()
-            sphere.SetRadius(0.3)
-            sphere.SetThetaResolution(16)
-            sphere.SetPhiResolution(16)
-            
-            mapper = vtk.vtkPolyDataMapper()
-            mapper.SetInputConnection(sphere.GetOutputPort())
-            
-            actor = vtk.vtkActor()
-            actor.SetMapper(mapper)
-            actor.GetProperty().SetColor(1.0, 1.0, 0.0)  # Yellow
-            actor.GetProperty().SetOpacity(0.9)
-            
-            self.electrical_particles.append({
-                'actor': actor,
-                'path': path_points,
-                'index': int(i * len(path_points) / num_particles)
-            })
-            
-            self.renderer.AddActor(actor)
+        self._elec_idx = np.linspace(
+            0, path_length, num_particles, endpoint=False
+        ).astype(np.int32)
+        self._elec_positions = self._elec_path_arr[self._elec_idx]
+        
+        self.electrical_points = vtk.vtkPoints()
+        if NUMPY_SUPPORT_AVAILABLE:
+            self.electrical_points.SetData(
+                numpy_support.numpy_to_vtk(self._elec_positions, deep=False)
+            )
+        else:
+            self.electrical_points.SetNumberOfPoints(num_particles)
+            self._push_electrical_positions()
+        
+        polydata = vtk.vtkPolyData()
+        polydata.SetPoints(self.electrical_points)
+        
+        glyph = vtk.vtkGlyph3D()
+        glyph.SetInputData(polydata)
+        glyph.SetSourceData(self._get_sphere_template(0.3, 10))
+        glyph.SetScaleModeToDataScalingOff()
+        
+        mapper = vtk.vtkPolyDataMapper()
+        mapper.SetInputConnection(glyph.GetOutputPort())
+        mapper.ScalarVisibilityOff()
+        
+        self.electrical_actor = vtk.vtkActor()
+        self.electrical_actor.SetMapper(mapper)
+        self.electrical_actor.GetProperty().SetColor(1.0, 1.0, 0.0)  # Yellow
+        self.electrical_actor.GetProperty().SetOpacity(0.9)
+        
+        self.renderer.AddActor(self.electrical_actor)
+    
+    def _push_electrical_positions(self):
+        """Notify VTK that the electrical particle positions changed"""
+        if not NUMPY_SUPPORT_AVAILABLE:
+            for i, position in enumerate(self._elec_positions):
+                self.electrical_points.SetPoint(i, position)
+        self.electrical_points.Modified()
     
     def create_electrical_path(self):
         """Create electrical conduction path"""
-        points = []
-        
         if self.organ_type == 'heart':
-            for i in range(50):
-                t = i / 50.0
-                x = 0
-                y = 1.5 - t * 3.5
-                z = np.sin(t * np.pi) * 0.4
-                points.append((x, y, z))
+            t = self._path_params(50)
+            return self._stack_path(0, 1.5 - t * 3.5, np.sin(t * np.pi) * 0.4)
         
         elif self.organ_type == 'brain':
-            for i in range(60):
-                t = i / 60.0
-                x = -2 + t * 4
-                y = 1 + np.sin(t * np.pi * 2) * 0.6
-                z = np.cos(t * np.pi) * 0.4
-                points.append((x, y, z))
-        
-        else:
-            for i in range(40):
-                t = i / 40.0
-                x = -1 + t * 2
-                y = t * 2
-                z = 0
-                points.append((x, y, z))
+            t = self._path_params(60)
+            return self._stack_path(
+                -2 + t * 4, 1 + np.sin(t * np.pi * 2) * 0.6, np.cos(t * np.pi) * 0.4
+            )
         
-        return points
+        t = self._path_params(40)
+        return self._stack_path(-1 + t * 2, t * 2, 0)
     
     def update_electrical_animation(self):
         """Update electrical signal positions"""
-        for particle in self.electrical_particles:
-            path = particle['path']
-            if not path:
-                continue
-            
-            particle['index'] = (particle['index'] + 1) % len(path)
-            position = path[particle['index']]
-            particle['actor'].SetPosition(position)
+        if self.electrical_actor is None or len(self._elec_path_arr) == 0:
+            return
+        
+        self._elec_idx += 1
+        np.mod(self._elec_idx, len(self._elec_path_arr), out=self._elec_idx)
+        np.take(self._elec_path_arr, self._elec_idx, axis=0, out=self._elec_positions)
+        self._push_electrical_positions()
+        self.needs_render = True
     
     def stop_electrical_animation(self):
         """Stop electrical signal animation"""
-        if self.electrical_timer:
-            self.electrical_timer.stop()
-            self.electrical_timer = None
-        
-        for particle in self.electrical_particles:
-            self.renderer.RemoveActor(particle['actor'])
-        self.electrical_particles = []
+        self.electrical_timer.stop()
+        
+        if self.electrical_actor is not None:
+            self.renderer.RemoveActor(self.electrical_actor)
+        self.electrical_actor = None
+        self.electrical_points = None
+        self._elec_path_arr = None
+        self._elec_idx = None
+        self._elec_positions = None
         self.electrical_index = 0
     
     # ========== CONTRACTION ANIMATION (LEGACY) ==========
@@ -717,8 +1008,6 @@ class AnimationManager:
         
         self.setup_heart_deformation()
         
-        self.contraction_timer = QTimer()
-        self.contraction_timer.timeout.connect(self.update_contraction_only)
         self.contraction_timer.start(50)
         
         self.deformation_phase = 0
@@ -731,9 +1020,7 @@ class AnimationManager:
     
     def stop_contraction_animation(self):
         """Stop contraction animation"""
-        if self.contraction_timer:
-            self.contraction_timer.stop()
-            self.contraction_timer = None
+        self.contraction_timer.stop()
         
         self.reset_deformation()
         self.deformation_phase = 0
@@ -742,15 +1029,21 @@ class AnimationManager:
     
     def is_flow_running(self):
         """Check if flow animation is running"""
-        return self.flow_timer is not None
+        return self.flow_thread is not None
     
     def is_electrical_running(self):
         """Check if electrical animation is running"""
-        return self.electrical_timer is not None
+        return self.electrical_timer.isActive()
     
     def is_contraction_running(self):
         """Check if contraction animation is running"""
-        return self.contraction_timer is not None
+        return self.contraction_timer.isActive()
+    
+    def take_render_request(self):
+        """Return True (once) if an animation changed the scene since last call"""
+        needs_render = self.needs_render
+        self.needs_render = False
+        return needs_render
     
     def stop_all_animations(self):
         """Stop all animations"""
@@ -3,7 +3,21 @@ Enhanced Anatomical Color Coding System
 Replaces config.py with intelligent keyword-based coloring
 """
 
-import colorsys
+import functools
+import hashlib
+import re
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Background color for VTK renderer (dark blue-gray)
 BACKGROUND_COLOR = (0.15, 0.15, 0.20)
@@ -118,7 +132,6 @@ ANATOMICAL_COLOR_RULES = {
             
             # General brain regions
             ('cerebrum', (0.92, 0.82, 0.72)),
-            ('brain_stem', (0.84, 0.74, 0.64)),
             
             # White vs Gray matter
             ('corpus_callosum', (0.95, 0.95, 1.0)),
@@ -239,6 +252,95 @@ DEFAULT_ORGAN_COLORS = {
     'teeth': (0.96, 0.96, 0.92)
 }
 
+# Part name normalization after lower(): '-' and ' ' -> '_' in one pass
+_NORMALIZE = str.maketrans('- ', '__')
+
+# ========== KEYWORD MATCHERS ==========
+# Built once at import. Each organ's rules are deduplicated and sorted by
+# descending keyword length (stable, so equal lengths keep their priority
+# order), then split into parallel keyword/color tuples.
+
+def _compile_rules(rules):
+    """
+    Return (keywords, colors, default) as parallel tuples.
+    Repeated keywords are dropped (the first occurrence wins) and the rest
+    ordered by descending keyword length; ANATOMICAL_COLOR_RULES itself is
+    left untouched. The color tuples are built once here and returned by
+    reference from every lookup, so repeated lookups allocate nothing.
+    """
+    ordered = []
+    seen = set()
+    for keyword, color in rules['keywords']:
+        if keyword not in seen:
+            seen.add(keyword)
+            ordered.append((keyword, color))
+    ordered.sort(key=lambda rule: len(rule[0]), reverse=True)
+    
+    keywords = tuple(keyword for keyword, _ in ordered)
+    colors = tuple(color for _, color in ordered)
+    return keywords, colors, rules['default']
+
+
+_COMPILED_RULES = {
+    organ: _compile_rules(rules) for organ, rules in ANATOMICAL_COLOR_RULES.items()
+}
+
+
+def _build_automaton(keywords):
+    """Aho-Corasick automaton: one pass over the name finds every keyword"""
+    automaton = ahocorasick.Automaton()
+    for rank, keyword in enumerate(keywords):
+        automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_regex(keywords):
+    """
+    One compiled alternation, longest keywords first. A plain search()
+    would stop at the leftmost hit, so the lookahead reports the longest
+    keyword starting at every position instead.
+    """
+    alternatives = '|'.join(re.escape(keyword) for keyword in keywords)
+    return re.compile(f'(?=({alternatives}))')
+
+
+_KEYWORD_AUTOMATA = {}
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATA = {
+        organ: _build_automaton(keywords)
+        for organ, (keywords, _, _) in _COMPILED_RULES.items()
+    }
+
+_ORGAN_REGEX = {
+    organ: _build_regex(keywords) for organ, (keywords, _, _) in _COMPILED_RULES.items()
+}
+_ORGAN_RANK = {
+    organ: {keyword: rank for rank, keyword in enumerate(keywords)}
+    for organ, (keywords, _, _) in _COMPILED_RULES.items()
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_keyword_color(organ_type, part_lower):
+    """
+    Return the color of the longest keyword found in part_lower
+    (ties go to the keyword listed first), or None if nothing matches.
+    """
+    colors = _COMPILED_RULES[organ_type][1]
+    
+    if AHOCORASICK_AVAILABLE:
+        ranks = (rank for _, rank in _KEYWORD_AUTOMATA[organ_type].iter(part_lower))
+    else:
+        rank_of = _ORGAN_RANK[organ_type]
+        ranks = (rank_of[m.group(1)] for m in _ORGAN_REGEX[organ_type].finditer(part_lower))
+    
+    # Lowest rank = longest (then highest priority) keyword
+    best = min(ranks, default=None)
+    return colors[best] if best is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
 def get_color_for_part(organ_type, part_name):
     """
     Get anatomically appropriate color for a part based on keywords
@@ -246,23 +348,39 @@ def get_color_for_part(organ_type, part_name):
     """
     if organ_type not in ANATOMICAL_COLOR_RULES:
         # Fallback to golden ratio for unknown organs
-        return get_color_for_label(organ_type, hash(part_name) % 100)
+        return get_color_for_label(organ_type, _stable_hash(part_name) % 100)
     
     # Normalize part name for matching
-    part_lower = part_name.lower().replace('-', '_').replace(' ', '_')
-    
-    # Get color rules for this organ
-    rules = ANATOMICAL_COLOR_RULES[organ_type]
+    part_lower = part_name.lower().translate(_NORMALIZE)
     
-    # Check keywords in order (most specific first)
-    for keyword, color in rules['keywords']:
-        if keyword in part_lower:
-            return color
+    color = _match_keyword_color(organ_type, part_lower)
+    if color is not None:
+        return color
     
     # No match found, use default for organ
-    return rules['default']
+    return _COMPILED_RULES[organ_type][2]
+
+
+def _stable_hash(text):
+    """
+    32-bit hash of a string that is the same in every session
+    (built-in hash() of str is randomized per process)
+    """
+    return int.from_bytes(hashlib.blake2s(text.encode('utf-8'), digest_size=4).digest(), 'big')
+
 
+def _hsv_to_rgb(h, s, v):
+    """Convert one HSV color to RGB (same formulas as colorsys.hsv_to_rgb)"""
+    h6 = h * 6.0
+    i = int(h6)
+    f = h6 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    return [(v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q)][i % 6]
 
+
+@functools.lru_cache(maxsize=4096)
 def get_color_for_label(organ_type, label_value):
     """
     Get color for a segmentation label using golden ratio
@@ -290,10 +408,11 @@ def get_color_for_label(organ_type, label_value):
         value = 0.90
     
     # Convert HSV to RGB
-    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
+    rgb = _hsv_to_rgb(hue, saturation, value)
     return rgb
 
 
+@functools.lru_cache(maxsize=4096)
 def get_color_by_name_similarity(organ_type, part_name):
     """
     Advanced color matching using partial string matching
@@ -302,25 +421,14 @@ def get_color_by_name_similarity(organ_type, part_name):
     if organ_type not in ANATOMICAL_COLOR_RULES:
         return DEFAULT_ORGAN_COLORS.get(organ_type, (0.8, 0.8, 0.8))
     
-    part_lower = part_name.lower().replace('-', '_').replace(' ', '_')
-    rules = ANATOMICAL_COLOR_RULES[organ_type]
-    
-    # Find best match with scoring
-    best_match = None
-    best_score = 0
-    
-    for keyword, color in rules['keywords']:
-        # Calculate match score (longer matches = better)
-        if keyword in part_lower:
-            score = len(keyword)
-            if score > best_score:
-                best_score = score
-                best_match = color
+    part_lower = part_name.lower().translate(_NORMALIZE)
     
+    # Find best match (longer matches = better)
+    best_match = _match_keyword_color(organ_type, part_lower)
     if best_match:
         return best_match
     
-    return rules['default']
+    return _COMPILED_RULES[organ_type][2]
 
 
 # ========== ORGAN CONFIGURATIONS ==========
@@ -416,6 +524,9 @@ def generate_hsv_colors(num_colors):
     if num_colors <= 0:
         return []
     
+    if NUMPY_AVAILABLE:
+        return _generate_hsv_colors_numpy(num_colors)
+    
     colors = []
     for i in range(num_colors):
         # Calculate evenly-spaced hue (0.0 to 1.0)
@@ -425,14 +536,43 @@ def generate_hsv_colors(num_colors):
         saturation = 0.85  # Not too pale, not too intense
         value = 0.95       # Bright but comfortable
         
-        # Convert HSV to RGB (colorsys returns 0.0-1.0 range)
-        r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
+        # Convert HSV to RGB (0.0-1.0 range)
+        r, g, b = _hsv_to_rgb(hue, saturation, value)
         
         colors.append((r, g, b))
     
     return colors
 
 
+@functools.lru_cache(maxsize=64)
+def _hsv_color_map(part_names):
+    """
+    Map each part name to its HSV color (alphabetical order).
+    Cached per scene: part_names is the tuple of all part names.
+    """
+    sorted_parts = sorted(part_names)
+    return dict(zip(sorted_parts, generate_hsv_colors(len(sorted_parts))))
+
+
+def _generate_hsv_colors_numpy(num_colors, saturation=0.85, value=0.95):
+    """Vectorized version of generate_hsv_colors (same HSV -> RGB as _hsv_to_rgb)"""
+    hue6 = np.arange(num_colors) / num_colors * 6.0
+    sector = hue6.astype(np.int32) % 6
+    f = hue6 - np.floor(hue6)
+    
+    v = np.full(num_colors, value)
+    p = np.full(num_colors, value * (1.0 - saturation))
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+    
+    # Per sector channel order, as in _hsv_to_rgb
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    
+    return [tuple(rgb) for rgb in np.stack([r, g, b], axis=1).tolist()]
+
+
 def get_color_for_part_hsv(organ_key, part_name, all_part_names):
     """
     HYBRID color assignment system:
@@ -451,30 +591,22 @@ def get_color_for_part_hsv(organ_key, part_name, all_part_names):
     Returns:
         tuple: RGB color (r, g, b) with values in [0.0, 1.0]
     """
-    # 1. Try anatomical color first (existing keyword-based system)
-    anatomical_color = get_color_for_part(organ_key, part_name)
-    
-    # 2. Check if it's a meaningful anatomical color (not the default)
-    default_color = DEFAULT_ORGAN_COLORS.get(organ_key, (0.8, 0.8, 0.8))
+    # Unknown organs keep their golden ratio color
+    if organ_key not in ANATOMICAL_COLOR_RULES:
+        return get_color_for_part(organ_key, part_name)
     
-    # If the anatomical color is NOT the default, use it
-    if anatomical_color != default_color:
+    # 1. Try anatomical color first (existing keyword-based system)
+    # 2. Use it only if a keyword actually matched
+    anatomical_color = _match_keyword_color(organ_key, part_name.lower().translate(_NORMALIZE))
+    if anatomical_color is not None:
         return anatomical_color
     
     # 3. No anatomical match found, use HSV color distribution
-    # Sort parts alphabetically for consistent color assignment across sessions
-    sorted_parts = sorted(all_part_names)
-    
-    # Generate HSV colors for all parts
-    hsv_colors = generate_hsv_colors(len(sorted_parts))
-    
-    # Find this part's index and return its HSV color
-    if part_name in sorted_parts:
-        index = sorted_parts.index(part_name)
-        return hsv_colors[index]
+    # (sorted alphabetically for consistent assignment across sessions)
+    hsv_map = _hsv_color_map(tuple(all_part_names))
     
     # Fallback to default gray if something goes wrong
-    return (0.7, 0.7, 0.7)
+    return hsv_map.get(part_name, (0.7, 0.7, 0.7))
 
 
 def get_color_for_part_pure_hsv(part_name, all_part_names):
@@ -489,19 +621,11 @@ def get_color_for_part_pure_hsv(part_name, all_part_names):
     Returns:
         tuple: RGB color (r, g, b) with values in [0.0, 1.0]
     """
-    # Sort parts alphabetically for consistent color assignment
-    sorted_parts = sorted(all_part_names)
-    
-    # Generate HSV colors
-    hsv_colors = generate_hsv_colors(len(sorted_parts))
-    
-    # Find this part's index
-    if part_name in sorted_parts:
-        index = sorted_parts.index(part_name)
-        return hsv_colors[index]
+    # Sorted alphabetically for consistent color assignment
+    hsv_map = _hsv_color_map(tuple(all_part_names))
     
     # Fallback
-    return (0.7, 0.7, 0.7)
+    return hsv_map.get(part_name, (0.7, 0.7, 0.7))
 
 
 def print_hsv_color_map(all_part_names):
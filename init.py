@@ -19,7 +19,14 @@ GUI module for 3D Medical Visualization System
 Contains user interface components
 """
 
-from main import MedicalVisualizationWindow
+import importlib
+
+# Export name -> defining module, imported on first attribute access.
+# One mapping for every section below, served by the single __getattr__
+# at the end of the file (the window pulls in the Qt/VTK stack).
+_LAZY_IMPORTS = {
+    'MedicalVisualizationWindow': 'main',
+}
 
 __all__ = ['MedicalVisualizationWindow']
 
@@ -32,8 +39,10 @@ Visualization module for 3D Medical Visualization System
 Contains visualization methods (clipping, MPR)
 """
 
-from visualization.clipping import ClippingManager
-from visualization.curved_mpr import CurvedMPRManager
+_LAZY_IMPORTS.update({
+    'ClippingManager': 'visualization.clipping',
+    'CurvedMPRManager': 'visualization.curved_mpr',
+})
 
 __all__ = ['ClippingManager', 'CurvedMPRManager']
 
@@ -46,8 +55,19 @@ Navigation module for 3D Medical Visualization System
 Contains navigation techniques and animations
 """
 
-from navigation.focus_navigation import FocusNavigationManager
-from navigation.animations import AnimationManager
-from navigation.flythrough import FlythroughManager
+_LAZY_IMPORTS.update({
+    'FocusNavigationManager': 'navigation.focus_navigation',
+    'AnimationManager': 'navigation.animations',
+    'FlythroughManager': 'navigation.flythrough',
+})
+
+__all__ = ['FocusNavigationManager', 'AnimationManager', 'FlythroughManager']
+
 
-__all__ = ['FocusNavigationManager', 'AnimationManager', 'FlythroughManager']
\ No newline at end of file
+def __getattr__(name):
+    """Import a lazily exported name on first access"""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value  # Cache for later lookups
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,8 @@ Automatic Dependency Installer for 3D Medical Visualization System
 Run this script to install all required packages
 """
 
+import importlib
+import importlib.util
 import subprocess
 import sys
 
@@ -19,16 +21,29 @@ def install_package(package_name):
         print(f"✗ Failed to install {package_name}")
         return False
 
+def install_packages(package_names):
+    """Install several packages with a single pip invocation"""
+    print(f"\n{'='*60}")
+    print(f"Installing {', '.join(package_names)}...")
+    print(f"{'='*60}")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *package_names])
+        return True
+    except subprocess.CalledProcessError:
+        print("✗ Batch installation failed, retrying packages one by one")
+        return False
+
 def check_package(package_name, import_name=None):
     """Check if a package is already installed"""
     if import_name is None:
         import_name = package_name
     
-    try:
-        __import__(import_name)
+    # find_spec only consults the import finders; it does not execute the
+    # module (importing vtk/SimpleITK just to check would load their libraries)
+    if importlib.util.find_spec(import_name) is not None:
         print(f"✓ {package_name} is already installed")
         return True
-    except ImportError:
+    else:
         print(f"✗ {package_name} is not installed")
         return False
 
@@ -62,10 +77,17 @@ def main():
         user_input = input("Proceed with installation? (y/n): ")
         
         if user_input.lower() == 'y':
-            failed = []
-            for package in to_install:
-                if not install_package(package):
-                    failed.append(package)
+            import_names = dict(packages)
+            if not install_packages(to_install):
+                for package in to_install:
+                    install_package(package)
+            
+            # Report per package by looking the modules up again
+            importlib.invalidate_caches()
+            failed = [
+                package for package in to_install
+                if importlib.util.find_spec(import_names[package]) is None
+            ]
             
             print(f"\n{'='*60}")
             if failed:
@@ -88,7 +110,8 @@ def main():
         print("  python main.py")
         print(f"{'='*60}\n")
     
-    # Verify installation
+    # Verify installation (pick up packages installed by this run)
+    importlib.invalidate_caches()
     print("Verifying installation...\n")
     all_ok = True
     
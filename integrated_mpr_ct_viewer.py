@@ -3,21 +3,176 @@ Integrated Professional MPR CT Viewer with Curved MPR
 Combines VTK 3D visualization with MPR slice viewing
 """
 
+import time
+from functools import partial
+
 import vtk
 import numpy as np
 import SimpleITK as sitk
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
                              QPushButton, QSlider, QLabel, QGroupBox, 
-                             QComboBox, QMessageBox, QSplitter, QCheckBox)
-from PyQt5.QtCore import Qt, QTimer
+                             QComboBox, QMessageBox, QSplitter, QCheckBox,
+                             QApplication)
+from PyQt5.QtCore import Qt, QTimer, QElapsedTimer, QObject, QThread, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QCursor
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 
+try:
+    from vtkmodules.util import numpy_support
+    NUMPY_SUPPORT_AVAILABLE = True
+except ImportError:
+    NUMPY_SUPPORT_AVAILABLE = False
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+try:
+    from scipy.ndimage import correlate1d
+    from scipy.interpolate import CubicSpline
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    import pyqtgraph as pg
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
+
+try:
+    import cupy
+    from cupyx.scipy.ndimage import map_coordinates as cupy_map_coordinates
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _sample_curve(scan, centers, normals, offsets, out):
+        """
+        Sample one perpendicular column per curve position (trilinear).
+        
+        Args:
+            scan: (D, H, W) volume
+            centers: (N, 3) x, y, z curve positions
+            normals: (N, 3) unit direction of each column
+            offsets: (H,) distances from the center along the normal
+            out: (H, N) float32 matrix the columns are written into
+        """
+        D, H, W = scan.shape
+        n = centers.shape[0]
+        slice_height = offsets.shape[0]
+        
+        for i in prange(n):
+            for row in range(slice_height):
+                offset = offsets[row]
+                x = centers[i, 0] + offset * normals[i, 0]
+                y = centers[i, 1] + offset * normals[i, 1]
+                z = centers[i, 2] + offset * normals[i, 2]
+                
+                # Clamp coordinates to volume bounds
+                x = min(max(x, 0.0), W - 1.001)
+                y = min(max(y, 0.0), H - 1.001)
+                z = min(max(z, 0.0), D - 1.001)
+                
+                x0, y0, z0 = int(np.floor(x)), int(np.floor(y)), int(np.floor(z))
+                x1, y1, z1 = min(x0 + 1, W - 1), min(y0 + 1, H - 1), min(z0 + 1, D - 1)
+                xd = x - x0
+                yd = y - y0
+                zd = z - z0
+                
+                c00 = scan[z0, y0, x0] * (1 - xd) + scan[z0, y0, x1] * xd
+                c01 = scan[z0, y1, x0] * (1 - xd) + scan[z0, y1, x1] * xd
+                c10 = scan[z1, y0, x0] * (1 - xd) + scan[z1, y0, x1] * xd
+                c11 = scan[z1, y1, x0] * (1 - xd) + scan[z1, y1, x1] * xd
+                
+                c0 = c00 * (1 - yd) + c01 * yd
+                c1 = c10 * (1 - yd) + c11 * yd
+                out[row, i] = c0 * (1 - zd) + c1 * zd
+    
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _to_world(pts, spacing, origin, out):
+        """Write voxel (N, 3) x, y, z points as world coordinates into out"""
+        for i in prange(pts.shape[0]):
+            out[i, 0] = pts[i, 0] * spacing[0] + origin[0]
+            out[i, 1] = pts[i, 1] * spacing[1] + origin[1]
+            out[i, 2] = pts[i, 2] * spacing[2] + origin[2]
+
+
+# Windowed slices kept for cine/scrubbing revisits (FIFO)
+_SLICE_CACHE_SIZE = 64
+
+# Cine playback rate; the timer fires once per frame.
+# Slow frames advance several slices at once so playback keeps real time.
+_CINE_FRAME_MS = 50  # 20 FPS
+
+# Value range covered by the window/level lookup tables (all of int16)
+_LUT_MIN = -32768
+_LUT_MAX = 32767
+
+
+# 3-tap Gaussian (sigma = 0.5) used to smooth the curved MPR image
+_SMOOTH_KERNEL = np.exp(-np.arange(-1, 2, dtype=np.float32) ** 2 / (2 * 0.5 ** 2))
+_SMOOTH_KERNEL /= _SMOOTH_KERNEL.sum()
+
+
+class CurvedMPRWorker(QObject):
+    """
+    Runs the curved MPR pipeline (interpolation, frames, sampling) off the
+    GUI thread and emits the image; the viewer displays it.
+    
+    A run is abandoned between stages once a newer generation is requested.
+    """
+    
+    finished = pyqtSignal(object, object, int)  # curve points, MPR image, generation
+    failed = pyqtSignal(str, int)
+    
+    def __init__(self, viewer):
+        super().__init__()
+        self.viewer = viewer
+        self.latest_generation = 0  # Written by the GUI thread
+    
+    @pyqtSlot(object, int)
+    def run(self, points, generation):
+        """Compute the curved MPR for points unless superseded"""
+        try:
+            if generation != self.latest_generation:
+                return
+            curve_points, tangents = self.viewer.interpolate_curve(points, return_tangents=True)
+            
+            if generation != self.latest_generation:
+                return
+            mpr_image = self.viewer.extract_perpendicular_slices(curve_points, tangents=tangents)
+            
+            if generation != self.latest_generation:
+                return
+            # Copy out of the shared buffer so the next run cannot overwrite it
+            if mpr_image is not None:
+                mpr_image = mpr_image.copy()
+            self.finished.emit(curve_points, mpr_image, generation)
+            
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.failed.emit(str(e), generation)
+
 
 class IntegratedMPRViewer(QWidget):
     """Professional MPR viewer integrated with VTK"""
     
+    curve_requested = pyqtSignal(object, int)  # Queued to CurvedMPRWorker.run
+    
     def __init__(self, renderer, model_loader, parent=None):
         super().__init__(parent)
         self.renderer = renderer
@@ -26,9 +181,18 @@ class IntegratedMPRViewer(QWidget):
         # MPR Data
         self.itk_image = None
         self.scan_array = None
+        self.scan_f32 = None  # C-contiguous float32 copy used for sampling/display
+        # Fallback when vtkImageReslice is unavailable: slice-major copies in
+        # the scan's native dtype (int16 for CT), so values stay exact
+        self._coronal = None  # (Y, Z, X) copy, coronal slices contiguous
+        self._sagittal = None  # (X, Z, Y) copy, sagittal slices contiguous
+        self._vtk_volume = None  # vtkImageData sharing scan_f32's buffer
+        self._reslicers = {}  # view -> (vtkImageReslice, axes, normal, shape)
         self.ct_dimensions = None
         self.ct_spacing = None
         self.ct_origin = None
+        self._spacing_f32 = None  # ct_spacing/ct_origin as float32 arrays
+        self._origin_f32 = None
         
         # Crosshair positions
         self.crosshair_x = 0
@@ -46,15 +210,38 @@ class IntegratedMPRViewer(QWidget):
         # Curved MPR
         self.curved_mpr_points = []  # User-drawn curve points
         self.curved_mpr_actors = []
+        self._curve_pipeline = None  # (path polydata, marker polydata) reused across generations
         self.is_drawing_curve = False
         self.curved_mpr_slices = []
+        self._curve_thread = None
+        self._curve_worker = None
+        self._curve_generation = 0
+        QApplication.instance().aboutToQuit.connect(self.stop_curve_worker)
+        self._mpr_buffer = None  # (slice_height, max positions) curved MPR image
+        self._d_vol = None  # scan_f32 on the GPU (cupy), kept between MPR generations
         
         # Cine mode
         self.is_playing_z = False
         self.is_playing_y = False
         self.is_playing_x = False
         self.cine_timer = QTimer(self)
+        self.cine_timer.setTimerType(Qt.PreciseTimer)
         self.cine_timer.timeout.connect(self.next_slice)
+        self._frame_in_flight = False  # Cine frame drawn but not yet presented
+        self._cine_clock = QElapsedTimer()
+        
+        # Coalesces bursts of slider events into one redraw per frame
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._do_update_all_views)
+        
+        # Views whose persistent matplotlib artists have been created
+        self._initialized = {}
+        self._bg = {}  # view -> cached background (image without crosshair)
+        self._view_state = {}  # view -> (slice, vmin, vmax, step, curve length)
+        self._luts = {}  # view -> (level, width, uint8 window/level LUT)
+        self._slice_cache = {}  # (view, index, level, width) -> windowed uint8 slice
         
         self.block_updates = False
         self.setup_ui()
@@ -71,22 +258,19 @@ class IntegratedMPRViewer(QWidget):
         views_layout = QGridLayout()
         
         # Axial view (top-left)
-        self.axial_fig, self.axial_ax = plt.subplots(figsize=(4, 4))
-        self.axial_canvas = FigureCanvas(self.axial_fig)
+        self.axial_fig, self.axial_ax, self.axial_canvas = self.create_slice_canvas('axial')
         axial_panel = self.create_view_panel('axial', self.axial_ax, 
                                              self.axial_canvas, "Axial (Z)")
         views_layout.addWidget(axial_panel, 0, 0)
         
         # Coronal view (top-right)
-        self.coronal_fig, self.coronal_ax = plt.subplots(figsize=(4, 4))
-        self.coronal_canvas = FigureCanvas(self.coronal_fig)
+        self.coronal_fig, self.coronal_ax, self.coronal_canvas = self.create_slice_canvas('coronal')
         coronal_panel = self.create_view_panel('coronal', self.coronal_ax,
                                                self.coronal_canvas, "Coronal (Y)")
         views_layout.addWidget(coronal_panel, 0, 1)
         
         # Sagittal view (bottom-left)
-        self.sagittal_fig, self.sagittal_ax = plt.subplots(figsize=(4, 4))
-        self.sagittal_canvas = FigureCanvas(self.sagittal_fig)
+        self.sagittal_fig, self.sagittal_ax, self.sagittal_canvas = self.create_slice_canvas('sagittal')
         sagittal_panel = self.create_view_panel('sagittal', self.sagittal_ax,
                                                 self.sagittal_canvas, "Sagittal (X)")
         views_layout.addWidget(sagittal_panel, 1, 0)
@@ -111,7 +295,7 @@ class IntegratedMPRViewer(QWidget):
         nav_layout.addWidget(QLabel("Z (Axial):"), 0, 0)
         self.axial_slider = QSlider(Qt.Horizontal)
         self.axial_slider.setRange(0, 0)
-        self.axial_slider.valueChanged.connect(lambda: self.update_crosshair('z'))
+        self.axial_slider.valueChanged.connect(self._on_axial_slider)
         nav_layout.addWidget(self.axial_slider, 0, 1)
         self.axial_label = QLabel("0")
         nav_layout.addWidget(self.axial_label, 0, 2)
@@ -120,7 +304,7 @@ class IntegratedMPRViewer(QWidget):
         nav_layout.addWidget(QLabel("Y (Coronal):"), 1, 0)
         self.coronal_slider = QSlider(Qt.Horizontal)
         self.coronal_slider.setRange(0, 0)
-        self.coronal_slider.valueChanged.connect(lambda: self.update_crosshair('y'))
+        self.coronal_slider.valueChanged.connect(self._on_coronal_slider)
         nav_layout.addWidget(self.coronal_slider, 1, 1)
         self.coronal_label = QLabel("0")
         nav_layout.addWidget(self.coronal_label, 1, 2)
@@ -129,7 +313,7 @@ class IntegratedMPRViewer(QWidget):
         nav_layout.addWidget(QLabel("X (Sagittal):"), 2, 0)
         self.sagittal_slider = QSlider(Qt.Horizontal)
         self.sagittal_slider.setRange(0, 0)
-        self.sagittal_slider.valueChanged.connect(lambda: self.update_crosshair('x'))
+        self.sagittal_slider.valueChanged.connect(self._on_sagittal_slider)
         nav_layout.addWidget(self.sagittal_slider, 2, 1)
         self.sagittal_label = QLabel("0")
         nav_layout.addWidget(self.sagittal_label, 2, 2)
@@ -179,6 +363,52 @@ class IntegratedMPRViewer(QWidget):
         layout.addStretch()
         return layout
     
+    def create_slice_canvas(self, view_name):
+        """
+        Create the drawing surface of an orthogonal view.
+        
+        With pyqtgraph the slice is an ImageItem updated in place and the
+        crosshair/curve are persistent items; otherwise a matplotlib figure.
+        
+        Returns:
+            (fig, ax, canvas) - fig and ax are None for pyqtgraph
+        """
+        if not PYQTGRAPH_AVAILABLE:
+            fig, ax = plt.subplots(figsize=(4, 4))
+            canvas = FigureCanvas(fig)
+            canvas.mpl_connect('draw_event', lambda event: self.on_view_draw(view_name))
+            # A resized canvas invalidates the cached background
+            canvas.mpl_connect('resize_event', lambda event: self._bg.pop(view_name, None))
+            return fig, ax, canvas
+        
+        canvas = pg.GraphicsLayoutWidget()
+        view_box = canvas.addViewBox(lockAspect=True)
+        view_box.setMenuEnabled(False)
+        
+        img = pg.ImageItem(axisOrder='row-major')
+        view_box.addItem(img)
+        
+        crosshair_pen = pg.mkPen((255, 255, 0, 180), width=1)
+        v_line = pg.InfiniteLine(angle=90, movable=False, pen=crosshair_pen)
+        h_line = pg.InfiniteLine(angle=0, movable=False, pen=crosshair_pen)
+        view_box.addItem(v_line)
+        view_box.addItem(h_line)
+        
+        curve = pg.PlotDataItem(pen=pg.mkPen((255, 0, 0, 204), width=2),
+                                symbol='o', symbolSize=5,
+                                symbolBrush='r', symbolPen=None)
+        view_box.addItem(curve)
+        
+        setattr(self, f'{view_name}_vb', view_box)
+        setattr(self, f'{view_name}_img', img)
+        setattr(self, f'{view_name}_vline', v_line)
+        setattr(self, f'{view_name}_hline', h_line)
+        setattr(self, f'{view_name}_curve', curve)
+        
+        canvas.scene().sigMouseClicked.connect(
+            lambda event: self.handle_pg_click(event, view_name))
+        return None, None, canvas
+    
     def create_view_panel(self, view_name, ax, canvas, title):
         """Create a view panel with window/level controls"""
         panel = QWidget()
@@ -191,8 +421,9 @@ class IntegratedMPRViewer(QWidget):
         
         # Canvas
         canvas.setCursor(QCursor(Qt.CrossCursor))
-        canvas.mpl_connect('button_press_event', 
-                          lambda event: self.handle_mouse_click(event, view_name))
+        if not PYQTGRAPH_AVAILABLE:
+            canvas.mpl_connect('button_press_event', 
+                              lambda event: self.handle_mouse_click(event, view_name))
         layout.addWidget(canvas)
         
         # Window/Level controls
@@ -202,7 +433,7 @@ class IntegratedMPRViewer(QWidget):
         level_slider = QSlider(Qt.Horizontal)
         level_slider.setRange(-1000, 3000)
         level_slider.setValue(40)
-        level_slider.valueChanged.connect(lambda: self.update_window_level(view_name))
+        level_slider.valueChanged.connect(partial(self.update_window_level, view_name))
         setattr(self, f'{view_name}_level_slider', level_slider)
         wl_layout.addWidget(level_slider)
         
@@ -214,7 +445,7 @@ class IntegratedMPRViewer(QWidget):
         width_slider = QSlider(Qt.Horizontal)
         width_slider.setRange(1, 2000)
         width_slider.setValue(400)
-        width_slider.valueChanged.connect(lambda: self.update_window_level(view_name))
+        width_slider.valueChanged.connect(partial(self.update_window_level, view_name))
         setattr(self, f'{view_name}_width_slider', width_slider)
         wl_layout.addWidget(width_slider)
         
@@ -252,14 +483,32 @@ class IntegratedMPRViewer(QWidget):
             return False
         
         try:
+            # The worker reads the volume - finish/abandon it before replacing it
+            self.stop_curve_worker()
+            
             # Get CT image from model loader
             self.itk_image = self.model_loader.ct_image
             self.scan_array = sitk.GetArrayFromImage(self.itk_image)
+            self.scan_f32 = np.ascontiguousarray(self.scan_array, dtype=np.float32)
+            self._mpr_buffer = np.empty((80, 400), dtype=np.float32)
+            self._d_vol = None
+            if CUPY_AVAILABLE:
+                try:
+                    self._d_vol = cupy.asarray(self.scan_f32)
+                except Exception as e:
+                    print(f"MPR Viewer - GPU volume upload failed, sampling on CPU: {e}")
+            
+            if not self.setup_reslicers():
+                # Fallback: slice-major copies so coronal/sagittal reads are not strided
+                self._coronal = np.ascontiguousarray(self.scan_array.transpose(1, 0, 2))
+                self._sagittal = np.ascontiguousarray(self.scan_array.transpose(2, 0, 1))
             
             # Get dimensions and spacing
             self.ct_dimensions = self.scan_array.shape  # (Z, Y, X)
             self.ct_spacing = self.itk_image.GetSpacing()
             self.ct_origin = self.itk_image.GetOrigin()
+            self._spacing_f32 = np.asarray(self.ct_spacing, dtype=np.float32)
+            self._origin_f32 = np.asarray(self.ct_origin, dtype=np.float32)
             
             print(f"MPR Viewer - CT loaded: {self.ct_dimensions}")
             
@@ -271,6 +520,75 @@ class IntegratedMPRViewer(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to load CT: {e}")
             return False
     
+    def setup_reslicers(self):
+        """
+        Wrap scan_f32 as vtkImageData and create one vtkImageReslice per
+        orthogonal plane, so slices are extracted in VTK's C++ core.
+        
+        Returns:
+            bool: True if the reslice path is available
+        """
+        self._reslicers = {}
+        self._vtk_volume = None
+        if not NUMPY_SUPPORT_AVAILABLE:
+            return False
+        
+        try:
+            # Voxel index space (spacing 1, origin 0) to match crosshair coordinates
+            D, H, W = self.scan_f32.shape
+            volume = vtk.vtkImageData()
+            volume.SetDimensions(W, H, D)
+            volume.GetPointData().SetScalars(numpy_support.numpy_to_vtk(
+                self.scan_f32.ravel(), deep=False, array_type=vtk.VTK_FLOAT))
+            self._vtk_volume = volume
+            
+            # view: (output x axis, output y axis, plane normal, (rows, cols))
+            planes = {
+                'axial': ((1, 0, 0), (0, 1, 0), (0, 0, 1), (H, W)),
+                'coronal': ((1, 0, 0), (0, 0, 1), (0, 1, 0), (D, W)),
+                'sagittal': ((0, 1, 0), (0, 0, 1), (1, 0, 0), (D, H)),
+            }
+            
+            for view, (axis_x, axis_y, normal, shape) in planes.items():
+                axes = vtk.vtkMatrix4x4()
+                for row in range(3):
+                    axes.SetElement(row, 0, axis_x[row])
+                    axes.SetElement(row, 1, axis_y[row])
+                    axes.SetElement(row, 2, normal[row])
+                
+                reslice = vtk.vtkImageReslice()
+                reslice.SetInputData(volume)
+                reslice.SetResliceAxes(axes)
+                reslice.SetOutputDimensionality(2)
+                reslice.SetInterpolationModeToLinear()
+                # int16 slices index the window/level LUT directly
+                reslice.SetOutputScalarType(vtk.VTK_SHORT)
+                reslice.SetOutputSpacing(1.0, 1.0, 1.0)
+                reslice.SetOutputOrigin(0.0, 0.0, 0.0)
+                reslice.SetOutputExtent(0, shape[1] - 1, 0, shape[0] - 1, 0, 0)
+                
+                self._reslicers[view] = (reslice, axes, normal, shape)
+            
+            return True
+            
+        except Exception as e:
+            print(f"MPR Viewer - vtkImageReslice unavailable, using NumPy slicing: {e}")
+            self._reslicers = {}
+            self._vtk_volume = None
+            return False
+    
+    def reslice_view(self, view_type, index):
+        """Extract one orthogonal slice through vtkImageReslice"""
+        reslice, axes, normal, shape = self._reslicers[view_type]
+        
+        # Move the plane along its normal
+        for row in range(3):
+            axes.SetElement(row, 3, normal[row] * index)
+        
+        reslice.Update()
+        scalars = reslice.GetOutput().GetPointData().GetScalars()
+        return numpy_support.vtk_to_numpy(scalars).reshape(shape)
+    
     def initialize_view(self):
         """Initialize view after loading CT"""
         if self.scan_array is None:
@@ -280,6 +598,14 @@ class IntegratedMPRViewer(QWidget):
         
         D, H, W = self.scan_array.shape
         
+        # Slice shapes may have changed - refit the view artists on first draw
+        self._slice_cache.clear()
+        for view in ['axial', 'coronal', 'sagittal']:
+            if self._initialized.get(view):
+                self.reset_view_artists(view)
+        self._bg = {}
+        self._view_state = {}
+        
         # Set slider ranges
         self.axial_slider.setRange(0, D - 1)
         self.axial_slider.setValue(D // 2)
@@ -311,25 +637,32 @@ class IntegratedMPRViewer(QWidget):
         self.block_updates = False
         self.update_all_views()
     
-    def update_crosshair(self, axis):
-        """Update crosshair position from slider"""
+    def _on_axial_slider(self, value):
+        """Update Z crosshair from the axial slider"""
         if self.scan_array is None or self.block_updates:
             return
-        
-        if axis == 'z':
-            self.crosshair_z = self.axial_slider.value()
-            self.axial_label.setText(str(self.crosshair_z))
-        elif axis == 'y':
-            self.crosshair_y = self.coronal_slider.value()
-            self.coronal_label.setText(str(self.crosshair_y))
-        elif axis == 'x':
-            self.crosshair_x = self.sagittal_slider.value()
-            self.sagittal_label.setText(str(self.crosshair_x))
-        
+        self.crosshair_z = value
+        self.axial_label.setText(str(value))
         self.update_all_views()
     
-    def update_window_level(self, view_name):
-        """Update window/level for a view"""
+    def _on_coronal_slider(self, value):
+        """Update Y crosshair from the coronal slider"""
+        if self.scan_array is None or self.block_updates:
+            return
+        self.crosshair_y = value
+        self.coronal_label.setText(str(value))
+        self.update_all_views()
+    
+    def _on_sagittal_slider(self, value):
+        """Update X crosshair from the sagittal slider"""
+        if self.scan_array is None or self.block_updates:
+            return
+        self.crosshair_x = value
+        self.sagittal_label.setText(str(value))
+        self.update_all_views()
+    
+    def update_window_level(self, view_name, value=None):
+        """Update window/level for a view (value is the emitting slider's, unused)"""
         if self.scan_array is None or self.block_updates:
             return
         
@@ -346,16 +679,41 @@ class IntegratedMPRViewer(QWidget):
     
     def handle_mouse_click(self, event, view_type):
         """Handle mouse clicks on MPR views"""
-        if self.scan_array is None or event.xdata is None or event.ydata is None:
+        if event.xdata is None or event.ydata is None:
+            return
+        self.handle_view_click(event.xdata, event.ydata, view_type)
+    
+    def handle_pg_click(self, event, view_type):
+        """Handle mouse clicks on pyqtgraph MPR views"""
+        if self.scan_array is None:
+            return
+        view_box = getattr(self, f'{view_type}_vb')
+        # sigMouseClicked fires for clicks anywhere in the scene
+        if not view_box.sceneBoundingRect().contains(event.scenePos()):
+            return
+        point = view_box.mapSceneToView(event.scenePos())
+        
+        # Image width/height of this view: axial (W, H), coronal (W, D), sagittal (H, D)
+        D, H, W = self.scan_array.shape
+        width, height = {'axial': (W, H), 'coronal': (W, D), 'sagittal': (H, D)}[view_type]
+        if not (0 <= point.x() < width and 0 <= point.y() < height):
             return
         
-        x_data = int(round(event.xdata))
-        y_data = int(round(event.ydata))
+        # pyqtgraph pixel i spans [i, i+1]; shift so rounding picks pixel i
+        self.handle_view_click(point.x() - 0.5, point.y() - 0.5, view_type)
+    
+    def handle_view_click(self, x, y, view_type):
+        """Move the crosshair (or add a curve point) at image coordinates x, y"""
+        if self.scan_array is None:
+            return
+        
+        x_data = int(round(x))
+        y_data = int(round(y))
         D, H, W = self.scan_array.shape
         
         # If drawing curve, add point
         if self.is_drawing_curve:
-            self.add_curve_point(event, view_type)
+            self.add_curve_point(x, y, view_type)
             return
         
         # Otherwise, update crosshair
@@ -389,14 +747,25 @@ class IntegratedMPRViewer(QWidget):
         self.update_all_views()
     
     def update_all_views(self):
+        """Schedule a redraw of all MPR views (coalesced to one per 16 ms)"""
+        if self.scan_array is None or self.block_updates:
+            return
+        # Throttle, not debounce: a continuous drag still redraws every frame
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+    
+    def _do_update_all_views(self):
         """Update all MPR views"""
         if self.scan_array is None or self.block_updates:
             return
         
-        # Get slices
-        axial_slice = self.scan_array[self.crosshair_z, :, :]
-        coronal_slice = self.scan_array[:, self.crosshair_y, :]
-        sagittal_slice = self.scan_array[:, :, self.crosshair_x]
+        # Get windowed slices
+        axial_slice = self._get_windowed_slice('axial', self.crosshair_z,
+                                               self.axial_L, self.axial_W)
+        coronal_slice = self._get_windowed_slice('coronal', self.crosshair_y,
+                                                 self.coronal_L, self.coronal_W)
+        sagittal_slice = self._get_windowed_slice('sagittal', self.crosshair_x,
+                                                  self.sagittal_L, self.sagittal_W)
         
         # Plot each view
         self.plot_slice(self.axial_ax, self.axial_canvas, axial_slice, 
@@ -408,37 +777,180 @@ class IntegratedMPRViewer(QWidget):
         self.plot_slice(self.sagittal_ax, self.sagittal_canvas, sagittal_slice,
                        'sagittal', self.sagittal_L, self.sagittal_W)
     
-    def plot_slice(self, ax, canvas, slice_data, view_type, level, width):
-        """Plot a single slice with crosshair"""
-        ax.clear()
+    def _get_windowed_slice(self, view_type, index, level, width):
+        """Return the uint8 windowed slice of a view, reusing recent results"""
+        key = (view_type, index, level, width)
+        windowed = self._slice_cache.get(key)
+        if windowed is not None:
+            return windowed
+        
+        if self._reslicers:
+            slice_data = self.reslice_view(view_type, index)
+        elif view_type == 'axial':
+            slice_data = self.scan_array[index, :, :]
+        elif view_type == 'coronal':
+            slice_data = self._coronal[index]
+        else:
+            slice_data = self._sagittal[index]
         
+        windowed = self.apply_window(slice_data, view_type, level, width)
+        
+        if len(self._slice_cache) >= _SLICE_CACHE_SIZE:
+            del self._slice_cache[next(iter(self._slice_cache))]  # Oldest first
+        self._slice_cache[key] = windowed
+        return windowed
+    
+    def plot_slice(self, ax, canvas, slice_data, view_type, level, width):
+        """Plot a single (already windowed, uint8) slice with crosshair"""
         # Window/Level
         vmin = level - (width / 2.0)
         vmax = level + (width / 2.0)
         
-        # Display slice
-        ax.imshow(slice_data, cmap='gray', origin='lower',
-                 vmin=vmin, vmax=vmax, interpolation='bilinear', aspect='equal')
-        
-        # Draw crosshair
-        H, W = slice_data.shape
-        
+        # Crosshair position in this view's image coordinates
         if view_type == 'axial':
-            ax.axvline(x=self.crosshair_x, color='yellow', linewidth=1, alpha=0.7)
-            ax.axhline(y=self.crosshair_y, color='yellow', linewidth=1, alpha=0.7)
+            cross_x, cross_y = self.crosshair_x, self.crosshair_y
+            slice_index = self.crosshair_z
         elif view_type == 'coronal':
-            ax.axvline(x=self.crosshair_x, color='yellow', linewidth=1, alpha=0.7)
-            ax.axhline(y=self.crosshair_z, color='yellow', linewidth=1, alpha=0.7)
-        elif view_type == 'sagittal':
-            ax.axvline(x=self.crosshair_y, color='yellow', linewidth=1, alpha=0.7)
-            ax.axhline(y=self.crosshair_z, color='yellow', linewidth=1, alpha=0.7)
+            cross_x, cross_y = self.crosshair_x, self.crosshair_z
+            slice_index = self.crosshair_y
+        else:
+            cross_x, cross_y = self.crosshair_y, self.crosshair_z
+            slice_index = self.crosshair_x
+        
+        if PYQTGRAPH_AVAILABLE:
+            # Update the existing items in place - no axes rebuild
+            getattr(self, f'{view_type}_img').setImage(
+                slice_data, levels=(0, 255),
+                autoLevels=False, autoDownsample=True)
+            getattr(self, f'{view_type}_vline').setPos(cross_x + 0.5)
+            getattr(self, f'{view_type}_hline').setPos(cross_y + 0.5)
+            self.draw_curve_on_view(ax, view_type)
+            return
+        
+        if not self._initialized.get(view_type):
+            self.create_view_artists(ax, view_type, slice_data.shape)
         
-        # Draw curve points if any
-        if self.curved_mpr_points:
+        # Decimate to the axes' on-screen pixel size before matplotlib resamples
+        rows, cols = slice_data.shape
+        step = max(1, min(rows // max(1, int(ax.bbox.height)),
+                          cols // max(1, int(ax.bbox.width))))
+        
+        v_line = getattr(self, f'{view_type}_vline')
+        h_line = getattr(self, f'{view_type}_hline')
+        v_line.set_xdata([cross_x, cross_x])
+        h_line.set_ydata([cross_y, cross_y])
+        
+        # Skip the image update when only the crosshair moved
+        state = (slice_index, vmin, vmax, step, len(self.curved_mpr_points))
+        if self._view_state.get(view_type) != state:
+            self._view_state[view_type] = state
+            
+            # Update the persistent artists instead of rebuilding the axes
+            image = getattr(self, f'{view_type}_im')
+            if step > 1:
+                slice_data = slice_data[::step, ::step]
+            if step != getattr(self, f'{view_type}_step'):
+                if getattr(self, f'{view_type}_step') == 0:
+                    # First slice since clear(): fit the limits to this volume
+                    ax.set_xlim(-0.5, cols - 0.5)
+                    ax.set_ylim(-0.5, rows - 0.5)
+                    self.set_view_artists_visible(view_type, True)
+                # Keep pixel centers at voxel coordinates (j * step)
+                rows, cols = slice_data.shape
+                image.set_extent((-0.5 * step, (cols - 0.5) * step,
+                                  -0.5 * step, (rows - 0.5) * step))
+                setattr(self, f'{view_type}_step', step)
+            image.set_data(slice_data)
+            
+            # Draw curve points if any
             self.draw_curve_on_view(ax, view_type)
         
+        if view_type in self._bg:
+            # Blit the animated artists over the cached (empty) axes
+            canvas.restore_region(self._bg[view_type])
+            self.draw_view_artists(view_type)
+            canvas.blit(ax.bbox)
+        else:
+            # First draw or after a resize; on_view_draw caches the background
+            canvas.draw_idle()
+    
+    def create_view_artists(self, ax, view_type, shape):
+        """Create the image, crosshair and curve artists of a matplotlib view once"""
+        ax.clear()
+        
+        # All artists are animated: the cached background is the empty axes
+        # and every update blits them (see draw_view_artists)
+        # Slices arrive already windowed to uint8 (see apply_window)
+        image = ax.imshow(np.zeros(shape, dtype=np.uint8), cmap='gray', origin='lower',
+                          vmin=0, vmax=255, interpolation='bilinear', aspect='equal',
+                          animated=True)
+        v_line = ax.axvline(x=0, color='yellow', linewidth=1, alpha=0.7, animated=True)
+        h_line = ax.axhline(y=0, color='yellow', linewidth=1, alpha=0.7, animated=True)
+        curve_line, = ax.plot([], [], 'r-', linewidth=2, alpha=0.8, animated=True)
+        curve_points, = ax.plot([], [], 'ro', markersize=5, animated=True)
+        
+        setattr(self, f'{view_type}_im', image)
+        setattr(self, f'{view_type}_vline', v_line)
+        setattr(self, f'{view_type}_hline', h_line)
+        setattr(self, f'{view_type}_curve_line', curve_line)
+        setattr(self, f'{view_type}_curve_points', curve_points)
+        setattr(self, f'{view_type}_step', 1)
+        
+        # Decimated images change the extent; keep the voxel-space limits
+        ax.set_autoscale_on(False)
         ax.axis('off')
-        canvas.draw_idle()
+        self._initialized[view_type] = True
+    
+    def reset_view_artists(self, view_type):
+        """Blank a view's persistent artists; the next slice refits the axes"""
+        getattr(self, f'{view_type}_im').set_data(np.zeros((1, 1), dtype=np.uint8))
+        getattr(self, f'{view_type}_curve_line').set_data([], [])
+        getattr(self, f'{view_type}_curve_points').set_data([], [])
+        self.set_view_artists_visible(view_type, False)
+        setattr(self, f'{view_type}_step', 0)
+    
+    def set_view_artists_visible(self, view_type, visible):
+        """Show or hide a view's crosshair and curve overlays"""
+        for name in ('vline', 'hline', 'curve_line', 'curve_points'):
+            getattr(self, f'{view_type}_{name}').set_visible(visible)
+    
+    def apply_window(self, slice_data, view_type, level, width):
+        """
+        Window/level a slice to uint8 with a per-view lookup table.
+        
+        The table covers the full int16 range and is rebuilt only when the
+        view's level or width changes. Slices of any other dtype are windowed
+        directly instead.
+        """
+        if slice_data.dtype != np.int16:
+            vmin = level - width / 2.0
+            return np.clip((slice_data - vmin) * 255.0 / width, 0, 255).astype(np.uint8)
+        
+        cached = self._luts.get(view_type)
+        if cached is None or cached[0] != level or cached[1] != width:
+            values = np.arange(_LUT_MIN, _LUT_MAX + 1, dtype=np.float32)
+            lut = np.clip((values - (level - width / 2.0)) * 255.0 / width, 0, 255).astype(np.uint8)
+            cached = (level, width, lut)
+            self._luts[view_type] = cached
+        
+        # Flipping the sign bit of the uint16 view gives value - _LUT_MIN
+        return cached[2][slice_data.view(np.uint16) ^ 0x8000]
+    
+    def on_view_draw(self, view_type):
+        """Cache a view's background after a full draw and overlay its artists"""
+        if not self._initialized.get(view_type):
+            return
+        
+        ax = getattr(self, f'{view_type}_ax')
+        canvas = getattr(self, f'{view_type}_canvas')
+        self._bg[view_type] = canvas.copy_from_bbox(ax.bbox)
+        self.draw_view_artists(view_type)
+    
+    def draw_view_artists(self, view_type):
+        """Draw a view's animated artists: image, curve, then crosshair on top"""
+        ax = getattr(self, f'{view_type}_ax')
+        for name in ('im', 'curve_line', 'curve_points', 'vline', 'hline'):
+            ax.draw_artist(getattr(self, f'{view_type}_{name}'))
     
     # ========== CURVED MPR FUNCTIONALITY ==========
     
@@ -454,30 +966,30 @@ class IntegratedMPRViewer(QWidget):
             self.curved_info_label.setText(f"Curve has {len(self.curved_mpr_points)} points")
             self.curved_info_label.setStyleSheet("color: blue;")
     
-    def add_curve_point(self, event, view_type):
+    def add_curve_point(self, x, y, view_type):
         """Add a point to the curved MPR path"""
-        if event.xdata is None or event.ydata is None:
-            return
-        
-        x_data = int(round(event.xdata))
-        y_data = int(round(event.ydata))
+        x_data = int(round(x))
+        y_data = int(round(y))
         D, H, W = self.scan_array.shape
         
         # Convert 2D click to 3D point based on view
         if view_type == 'axial':
             # Axial view: use current Z
-            if 0 <= x_data < W and 0 <= y_data < H:
-                point_3d = (x_data, y_data, self.crosshair_z)
+            if not (0 <= x_data < W and 0 <= y_data < H):
+                return
+            point_3d = (x_data, y_data, self.crosshair_z)
         
         elif view_type == 'coronal':
             # Coronal view: use current Y
-            if 0 <= x_data < W and 0 <= y_data < D:
-                point_3d = (x_data, self.crosshair_y, y_data)
+            if not (0 <= x_data < W and 0 <= y_data < D):
+                return
+            point_3d = (x_data, self.crosshair_y, y_data)
         
         elif view_type == 'sagittal':
             # Sagittal view: use current X
-            if 0 <= x_data < H and 0 <= y_data < D:
-                point_3d = (self.crosshair_x, x_data, y_data)
+            if not (0 <= x_data < H and 0 <= y_data < D):
+                return
+            point_3d = (self.crosshair_x, x_data, y_data)
         else:
             return
         
@@ -489,23 +1001,29 @@ class IntegratedMPRViewer(QWidget):
     
     def draw_curve_on_view(self, ax, view_type):
         """Draw curve points on a view"""
-        if not self.curved_mpr_points:
+        if len(self.curved_mpr_points) < 2:
+            if PYQTGRAPH_AVAILABLE:
+                getattr(self, f'{view_type}_curve').setData([], [])
+            else:
+                getattr(self, f'{view_type}_curve_line').set_data([], [])
+                getattr(self, f'{view_type}_curve_points').set_data([], [])
             return
         
-        # Extract coordinates based on view
-        points_2d = []
-        for px, py, pz in self.curved_mpr_points:
-            if view_type == 'axial':
-                points_2d.append((px, py))
-            elif view_type == 'coronal':
-                points_2d.append((px, pz))
-            elif view_type == 'sagittal':
-                points_2d.append((py, pz))
-        
-        if len(points_2d) > 1:
-            xs, ys = zip(*points_2d)
-            ax.plot(xs, ys, 'r-', linewidth=2, alpha=0.8)
-            ax.plot(xs, ys, 'ro', markersize=5)
+        # Extract coordinates based on view (columns of the x, y, z array);
+        # picks are integer voxel indices, so int16 holds them exactly
+        pts = np.asarray(self.curved_mpr_points, dtype=np.int16)
+        if view_type == 'axial':
+            xs, ys = pts[:, 0], pts[:, 1]
+        elif view_type == 'coronal':
+            xs, ys = pts[:, 0], pts[:, 2]
+        else:
+            xs, ys = pts[:, 1], pts[:, 2]
+        
+        if PYQTGRAPH_AVAILABLE:
+            getattr(self, f'{view_type}_curve').setData(xs + 0.5, ys + 0.5)
+        else:
+            getattr(self, f'{view_type}_curve_line').set_data(xs, ys)
+            getattr(self, f'{view_type}_curve_points').set_data(xs, ys)
     
     def clear_curve(self):
         """Clear the curved MPR curve"""
@@ -514,10 +1032,16 @@ class IntegratedMPRViewer(QWidget):
         self.is_drawing_curve = False
         self.draw_curve_btn.setChecked(False)
         
+        # Drop any curved MPR still being generated
+        self._curve_generation += 1
+        if self._curve_worker is not None:
+            self._curve_worker.latest_generation = self._curve_generation
+        
         # Clear 3D curve visualization
         for actor in self.curved_mpr_actors:
             self.renderer.RemoveActor(actor)
         self.curved_mpr_actors = []
+        self._curve_pipeline = None
         
         self.curved_info_label.setText("Curve cleared. Draw new curve.")
         self.curved_info_label.setStyleSheet("color: gray; font-style: italic;")
@@ -534,45 +1058,90 @@ class IntegratedMPRViewer(QWidget):
         self.update_all_views()
     
     def generate_curved_mpr(self):
-        """Generate curved MPR from drawn curve"""
+        """Generate curved MPR from drawn curve on the worker thread"""
         if len(self.curved_mpr_points) < 2:
             QMessageBox.warning(self, "Need More Points",
                               "Please draw a curve with at least 2 points")
             return
         
+        if self._curve_thread is None:
+            self._curve_worker = CurvedMPRWorker(self)
+            self._curve_thread = QThread()
+            self._curve_worker.moveToThread(self._curve_thread)
+            self.curve_requested.connect(self._curve_worker.run)
+            self._curve_worker.finished.connect(self._display_curved_mpr_result)
+            self._curve_worker.failed.connect(self._curved_mpr_failed)
+            self._curve_thread.start()
+        
+        # A newer request makes any in-flight run abort at its next stage
+        self._curve_generation += 1
+        self._curve_worker.latest_generation = self._curve_generation
+        
+        self.curved_info_label.setText("Generating MPR...")
+        self.curved_info_label.setStyleSheet("color: blue;")
+        self.curve_requested.emit(list(self.curved_mpr_points), self._curve_generation)
+    
+    def _display_curved_mpr_result(self, curve_points, mpr_image, generation):
+        """Show a finished curved MPR (GUI thread)"""
+        if generation != self._curve_generation:
+            return
+        
         try:
-            # Interpolate curve to get smooth path
-            curve_points = self.interpolate_curve(self.curved_mpr_points)
-            
-            # Extract perpendicular slices along curve
-            mpr_slices = self.extract_perpendicular_slices(curve_points)
-            
-            if not mpr_slices:
+            if mpr_image is None:
                 QMessageBox.warning(self, "MPR Failed", 
                                   "Could not extract slices along curve")
                 return
             
             # Display curved MPR
-            self.display_curved_mpr(mpr_slices)
+            self.display_curved_mpr(mpr_image)
             
             # Visualize curve in 3D
             self.visualize_curve_in_3d(curve_points)
             
-            self.curved_info_label.setText(f"âœ“ MPR generated with {len(mpr_slices)} slices")
+            self.curved_info_label.setText(f"âœ“ MPR generated with {mpr_image.shape[1]} slices")
             self.curved_info_label.setStyleSheet("color: green; font-weight: bold;")
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to generate MPR: {e}")
             import traceback
             traceback.print_exc()
+    
+    def _curved_mpr_failed(self, message, generation):
+        """Report a worker error (GUI thread)"""
+        if generation != self._curve_generation:
+            return
+        QMessageBox.critical(self, "Error", f"Failed to generate MPR: {message}")
+    
+    def stop_curve_worker(self):
+        """Abandon any pending run and stop the curved MPR thread"""
+        if self._curve_thread is None:
+            return
+        self._curve_generation += 1
+        self._curve_worker.latest_generation = self._curve_generation
+        self._curve_thread.quit()
+        self._curve_thread.wait()
+        self._curve_thread = None
+        self._curve_worker = None
 
-    def interpolate_curve(self, points, num_samples=200):
-        """Interpolate curve points using spline for smooth path"""
+    def interpolate_curve(self, points, num_samples=200, return_tangents=False):
+        """
+        Interpolate curve points using spline for smooth path.
+        
+        Args:
+            points: List of (x, y, z) control points
+            num_samples: Number of output samples (adapted to curve length)
+            return_tangents: Also return the spline derivative at each sample
+                (None when scipy is not available)
+        
+        Returns:
+            (N, 3) float32 array of x, y, z samples (and the (N, 3) tangents)
+        """
         if len(points) < 2:
-            return points
+            result = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+            return (result, None) if return_tangents else result
         
         # Convert to numpy array
-        points_array = np.array(points)
+        points_array = np.array(points, dtype=float)
         
         # Calculate cumulative arc length
         distances = np.sqrt(np.sum(np.diff(points_array, axis=0)**2, axis=1))
@@ -588,143 +1157,206 @@ class IntegratedMPRViewer(QWidget):
         # Create evenly spaced samples along the curve
         sample_distances = np.linspace(0, total_length, num_samples)
         
-        # Interpolate each coordinate
-        interpolated = []
-        for i in range(3):  # x, y, z
-            interp_coord = np.interp(sample_distances, cumulative_distances, points_array[:, i])
-            interpolated.append(interp_coord)
-        
-        # Combine into points list
-        result = [(interpolated[0][i], interpolated[1][i], interpolated[2][i]) 
-                for i in range(num_samples)]
+        tangents = None
+        # Spline needs strictly increasing knots - drop repeated clicks
+        unique = np.concatenate([[True], distances > 0])
+        if SCIPY_AVAILABLE and np.count_nonzero(unique) >= 2:
+            # All three coordinates in one natural cubic spline
+            spline = CubicSpline(cumulative_distances[unique], points_array[unique],
+                                 axis=0, bc_type='natural')
+            result = spline(sample_distances).astype(np.float32)
+            tangents = spline(sample_distances, 1).astype(np.float32)
+        else:
+            # Interpolate each coordinate (piecewise linear)
+            result = np.column_stack([
+                np.interp(sample_distances, cumulative_distances, points_array[:, i])
+                for i in range(3)  # x, y, z
+            ]).astype(np.float32)
         
-        return result
+        return (result, tangents) if return_tangents else result
 
-    def extract_perpendicular_slices(self, curve_points, slice_thickness=2):
-        """Extract perpendicular slices along the curve using proper resampling"""
-        slices = []
-        D, H, W = self.scan_array.shape
+    def extract_perpendicular_slices(self, curve_points, slice_thickness=2, tangents=None):
+        """
+        Extract perpendicular slices along the curve using proper resampling.
+        
+        Args:
+            curve_points: (N, 3) x, y, z curve samples
+            tangents: Optional (N, 3) curve derivative (e.g. from the spline)
+        
+        Returns:
+            (slice_height, N) float32 view of the reusable MPR buffer - each
+            column is one curve position - or None if the curve is degenerate
+        """
         slice_height = 80  # Height of perpendicular slice (vertical in final image)
         
-        # Process every point or use adaptive step for very long curves
-        step = max(1, len(curve_points) // 400)
+        centers, normals = self.compute_curve_frames(curve_points, tangents)
+        n = len(centers)
+        if n == 0:
+            return None
         
-        for i in range(0, len(curve_points) - 1, step):
-            try:
-                # Current point and calculate tangent
-                p1 = np.array(curve_points[max(0, i-1)])
-                p2 = np.array(curve_points[min(len(curve_points)-1, i+1)])
-                
-                center = np.array(curve_points[i])
-                
-                # Tangent vector (direction of curve)
-                tangent = p2 - p1
-                tangent_length = np.linalg.norm(tangent)
-                
-                if tangent_length < 0.01:
-                    continue
-                
-                tangent = tangent / tangent_length
-                
-                # Create orthonormal basis for the slice plane
-                # Choose an arbitrary vector not parallel to tangent
-                if abs(tangent[2]) < 0.9:
-                    arbitrary = np.array([0, 0, 1])
-                else:
-                    arbitrary = np.array([0, 1, 0])
-                
-                # First perpendicular vector (normal 1)
-                normal1 = np.cross(tangent, arbitrary)
-                normal1 = normal1 / np.linalg.norm(normal1)
-                
-                # Second perpendicular vector (normal 2) - completes orthonormal basis
-                normal2 = np.cross(tangent, normal1)
-                normal2 = normal2 / np.linalg.norm(normal2)
-                
-                # Extract ONE column of perpendicular slice (1D profile)
-                # This will become one vertical line in the final curved MPR
-                slice_column = np.zeros(slice_height)
-                
-                # Sample points along the perpendicular direction (normal2)
-                for row in range(slice_height):
-                    # Offset from center along perpendicular direction
-                    offset = (row - slice_height/2) * 1.0
-                    
-                    # 3D position in volume
-                    pos = center + offset * normal2
-                    
-                    # Get intensity using trilinear interpolation
-                    intensity = self.trilinear_interpolation(pos[0], pos[1], pos[2])
-                    slice_column[row] = intensity
-                
-                slices.append(slice_column)
-                
-            except Exception as e:
-                continue
+        # Grow the preallocated image only when a curve needs more columns
+        if (self._mpr_buffer is None or self._mpr_buffer.shape[0] != slice_height
+                or self._mpr_buffer.shape[1] < n):
+            self._mpr_buffer = np.empty((slice_height, max(400, n)), dtype=np.float32)
+        mpr_image = self._mpr_buffer[:, :n]
         
-        return slices
-
+        # Offsets from center along the perpendicular direction (normal2)
+        offsets = np.arange(slice_height, dtype=np.float32) - slice_height / 2
+        
+        if self._d_vol is not None:
+            mpr_image[...] = self.sample_curve_gpu(centers, normals, offsets)
+            return mpr_image
+        
+        if NUMBA_AVAILABLE:
+            # One compiled pass over all columns
+            _sample_curve(self.scan_f32, centers, normals, offsets, mpr_image)
+            return mpr_image
+        
+        # (H, N, 3) sample positions: one column per curve position
+        pos = offsets[:, None, None] * normals[None, :, :] + centers[None, :, :]
+        
+        # Each column becomes one vertical line in the final curved MPR
+        mpr_image[...] = self.trilinear_interpolation_batch(pos)
+        return mpr_image
 
+    def sample_curve_gpu(self, centers, normals, offsets):
+        """
+        Sample the curved MPR on the GPU with linear map_coordinates.
+        
+        Returns:
+            (H, N) float32 NumPy array
+        """
+        D, H, W = self._d_vol.shape
+        d_centers = cupy.asarray(centers)
+        d_normals = cupy.asarray(normals)
+        d_offsets = cupy.asarray(offsets)
+        
+        # (H, N, 3) sample positions, clamped to volume bounds like the CPU paths
+        pos = d_offsets[:, None, None] * d_normals[None, :, :] + d_centers[None, :, :]
+        xs = cupy.clip(pos[..., 0], 0, W - 1)
+        ys = cupy.clip(pos[..., 1], 0, H - 1)
+        zs = cupy.clip(pos[..., 2], 0, D - 1)
+        
+        coords = cupy.stack([zs.ravel(), ys.ravel(), xs.ravel()])
+        values = cupy_map_coordinates(self._d_vol, coords, order=1, mode='nearest')
+        return cupy.asnumpy(values.reshape(pos.shape[:2]))
+    
+    def compute_curve_frames(self, curve_points, tangents=None):
+        """
+        Compute the sampling frame of every curve position.
+        
+        Args:
+            curve_points: (N, 3) x, y, z curve samples
+            tangents: Optional (N, 3) curve derivative; estimated from
+                neighbouring points when not given
+        
+        Returns:
+            centers, normals: (N, 3) float32 arrays (x, y, z); normals is the
+            perpendicular direction each MPR column is sampled along
+        """
+        curve = np.asarray(curve_points, dtype=np.float32).reshape(-1, 3)
+        n = len(curve)
+        
+        # Process every point or use adaptive step for very long curves
+        step = max(1, n // 400)
+        idx = np.arange(0, n - 1, step)
+        
+        # Tangent vector (direction of curve)
+        if tangents is not None:
+            tangents = np.asarray(tangents, dtype=np.float32).reshape(-1, 3)[idx]
+        else:
+            # Estimate from neighbouring points
+            tangents = curve[np.minimum(idx + 1, n - 1)] - curve[np.maximum(idx - 1, 0)]
+        lengths = np.linalg.norm(tangents, axis=1, keepdims=True)
+        
+        keep = lengths[:, 0] >= 0.01
+        idx = idx[keep]
+        tangents = tangents[keep] / lengths[keep]
+        
+        # Choose an arbitrary vector not parallel to tangent (branchless)
+        arbitrary = np.where(np.abs(tangents[:, 2:3]) < 0.9,
+                             np.array([0, 0, 1], dtype=np.float32),
+                             np.array([0, 1, 0], dtype=np.float32))
+        
+        # First perpendicular vector (normal 1)
+        normal1 = np.cross(tangents, arbitrary)
+        normal1 /= np.linalg.norm(normal1, axis=1, keepdims=True)
+        
+        # Second perpendicular vector (normal 2) - completes orthonormal basis
+        normal2 = np.cross(tangents, normal1)
+        normal2 /= np.linalg.norm(normal2, axis=1, keepdims=True)
+        
+        return (np.ascontiguousarray(curve[idx]),
+                np.ascontiguousarray(normal2, dtype=np.float32))
 
-    def trilinear_interpolation(self, x, y, z):
-        """Perform trilinear interpolation for smooth sampling"""
-        D, H, W = self.scan_array.shape
+    def trilinear_interpolation_batch(self, points_xyz):
+        """
+        Trilinear interpolation of many points at once.
+        
+        Args:
+            points_xyz: (..., 3) array of x, y, z voxel coordinates
+        
+        Returns:
+            float32 array of shape points_xyz.shape[:-1]
+        """
+        scan = self.scan_f32
+        D, H, W = scan.shape
+        pos = np.asarray(points_xyz, dtype=np.float32)
         
         # Clamp coordinates to volume bounds
-        x = np.clip(x, 0, W - 1.001)
-        y = np.clip(y, 0, H - 1.001)
-        z = np.clip(z, 0, D - 1.001)
+        x = np.clip(pos[..., 0], 0, W - 1.001)
+        y = np.clip(pos[..., 1], 0, H - 1.001)
+        z = np.clip(pos[..., 2], 0, D - 1.001)
         
         # Get integer parts
-        x0, y0, z0 = int(np.floor(x)), int(np.floor(y)), int(np.floor(z))
-        x1, y1, z1 = min(x0 + 1, W - 1), min(y0 + 1, H - 1), min(z0 + 1, D - 1)
+        x0 = np.floor(x).astype(np.int32)
+        y0 = np.floor(y).astype(np.int32)
+        z0 = np.floor(z).astype(np.int32)
+        x1 = np.minimum(x0 + 1, W - 1)
+        y1 = np.minimum(y0 + 1, H - 1)
+        z1 = np.minimum(z0 + 1, D - 1)
         
         # Get fractional parts
         xd = x - x0
         yd = y - y0
         zd = z - z0
         
-        # Get values at 8 corners of the cube
-        c000 = self.scan_array[z0, y0, x0]
-        c001 = self.scan_array[z0, y0, x1]
-        c010 = self.scan_array[z0, y1, x0]
-        c011 = self.scan_array[z0, y1, x1]
-        c100 = self.scan_array[z1, y0, x0]
-        c101 = self.scan_array[z1, y0, x1]
-        c110 = self.scan_array[z1, y1, x0]
-        c111 = self.scan_array[z1, y1, x1]
+        # Gather the 8 corners of every cube
+        c000 = scan[z0, y0, x0]
+        c001 = scan[z0, y0, x1]
+        c010 = scan[z0, y1, x0]
+        c011 = scan[z0, y1, x1]
+        c100 = scan[z1, y0, x0]
+        c101 = scan[z1, y0, x1]
+        c110 = scan[z1, y1, x0]
+        c111 = scan[z1, y1, x1]
         
         # Interpolate along x
-        c00 = c000 * (1 - xd) + c001 * xd
-        c01 = c010 * (1 - xd) + c011 * xd
-        c10 = c100 * (1 - xd) + c101 * xd
-        c11 = c110 * (1 - xd) + c111 * xd
+        c00 = c000 + (c001 - c000) * xd
+        c01 = c010 + (c011 - c010) * xd
+        c10 = c100 + (c101 - c100) * xd
+        c11 = c110 + (c111 - c110) * xd
         
         # Interpolate along y
-        c0 = c00 * (1 - yd) + c01 * yd
-        c1 = c10 * (1 - yd) + c11 * yd
+        c0 = c00 + (c01 - c00) * yd
+        c1 = c10 + (c11 - c10) * yd
         
         # Interpolate along z
-        c = c0 * (1 - zd) + c1 * zd
-        
-        return c
+        return c0 + (c1 - c0) * zd
 
-    def display_curved_mpr(self, slices):
+    def display_curved_mpr(self, mpr_image):
         """Display curved MPR as straightened view - each slice is a vertical column"""
-        if not slices:
+        if mpr_image is None or mpr_image.shape[1] == 0:
             return
+        num_positions = mpr_image.shape[1]
         
-        # Stack slices horizontally - each slice becomes a vertical column
-        # This creates the proper curved MPR visualization
-        mpr_image = np.column_stack(slices)
-        
-        # Apply slight smoothing to reduce artifacts
-        try:
-            from scipy.ndimage import gaussian_filter
-            if len(slices) > 5:
-                mpr_image = gaussian_filter(mpr_image, sigma=0.5)
-        except ImportError:
-            pass  # Skip smoothing if scipy not available
+        # Apply slight smoothing to reduce artifacts (skipped without cv2/scipy)
+        if num_positions > 5:
+            if CV2_AVAILABLE:
+                mpr_image = cv2.GaussianBlur(mpr_image, (3, 3), 0.5)
+            elif SCIPY_AVAILABLE:
+                mpr_image = correlate1d(mpr_image, _SMOOTH_KERNEL, axis=0)
+                mpr_image = correlate1d(mpr_image, _SMOOTH_KERNEL, axis=1)
         
         # Display with proper aspect ratio
         self.curved_ax.clear()
@@ -732,96 +1364,171 @@ class IntegratedMPRViewer(QWidget):
                             vmin=self.axial_L - self.axial_W/2,
                             vmax=self.axial_L + self.axial_W/2,
                             interpolation='bilinear')
-        self.curved_ax.set_title(f"Curved MPR ({len(slices)} positions)")
+        self.curved_ax.set_title(f"Curved MPR ({num_positions} positions)")
         self.curved_ax.set_xlabel("Position along curve")
         self.curved_ax.set_ylabel("Perpendicular distance")
         self.curved_canvas.draw_idle()
         
         # Store for later use
-        self.curved_mpr_slices = slices
+        self.curved_mpr_slices = mpr_image
 
 
     def visualize_curve_in_3d(self, curve_points):
-        """Visualize the curve path in 3D VTK view"""
-        # Clear previous curve actors
-        for actor in self.curved_mpr_actors:
-            self.renderer.RemoveActor(actor)
-        self.curved_mpr_actors = []
-        
-        if len(curve_points) < 2:
+        """
+        Visualize the curve path in 3D VTK view.
+        
+        Uses one line actor (drawn as a tube) and one glyph actor for the markers; on
+        regeneration their polydata is updated in place.
+        """
+        # One contiguous float32 (N, 3) array for every step below
+        curve = np.ascontiguousarray(curve_points, dtype=np.float32).reshape(-1, 3)
+        if len(curve) < 2:
+            # Clear previous curve actors
+            for actor in self.curved_mpr_actors:
+                self.renderer.RemoveActor(actor)
+            self.curved_mpr_actors = []
+            self._curve_pipeline = None
             return
         
-        # Create VTK points
-        points = vtk.vtkPoints()
-        for x, y, z in curve_points:
-            # Convert voxel coordinates to world coordinates
-            if self.ct_spacing and self.ct_origin:
-                wx = x * self.ct_spacing[0] + self.ct_origin[0]
-                wy = y * self.ct_spacing[1] + self.ct_origin[1]
-                wz = z * self.ct_spacing[2] + self.ct_origin[2]
-                points.InsertNextPoint(wx, wy, wz)
+        # Convert voxel coordinates to world coordinates
+        if self._spacing_f32 is not None:
+            if NUMBA_AVAILABLE:
+                world = np.empty_like(curve)
+                _to_world(curve, self._spacing_f32, self._origin_f32, world)
+                curve = world
             else:
-                points.InsertNextPoint(x, y, z)
-        
-        # Create polyline
-        polyline = vtk.vtkPolyLine()
-        polyline.GetPointIds().SetNumberOfIds(len(curve_points))
-        for i in range(len(curve_points)):
-            polyline.GetPointIds().SetId(i, i)
+                # SoA: one contiguous multiply-add pass per axis, transposed
+                # back only when copied into vtkPoints
+                soa = curve.T.copy()
+                soa *= self._spacing_f32[:, None]
+                soa += self._origin_f32[:, None]
+                curve = soa.T
+        
+        if self._curve_pipeline is None:
+            self._curve_pipeline = self.create_curve_pipeline()
+        path_polydata, marker_polydata = self._curve_pipeline
+        
+        # Curve path: one polyline cell, thinned on straight stretches
+        path = self._resample_by_curvature(curve)
+        path_polydata.SetPoints(self.to_vtk_points(path))
+        path_polydata.SetLines(self.polyline_cells(len(path)))
+        path_polydata.Modified()
+        
+        # Spheres at every 10th point, drawn by the glyph mapper
+        marker_polydata.SetPoints(self.to_vtk_points(curve[::10]))
+        marker_polydata.Modified()
+    
+    def _resample_by_curvature(self, pts, sparse_factor=4.0, alpha=8.0):
+        """
+        Thin a densely sampled curve before it is drawn.
+        
+        Straight stretches keep roughly one point per sparse_factor segments;
+        where the discrete curvature |p[i-1] - 2 p[i] + p[i+1]| is high the
+        spacing shrinks towards every point. First and last points are kept.
+        
+        Args:
+            pts: (N, 3) curve points
+            sparse_factor: Spacing on straights, in mean segment lengths
+            alpha: How strongly curvature tightens the spacing
+        """
+        n = len(pts)
+        if n < 4:
+            return pts
+        
+        segment = np.linalg.norm(np.diff(pts, axis=0), axis=1)
+        mean_segment = segment.mean()
+        if mean_segment <= 0:
+            return pts
+        
+        # Normalized discrete curvature (0 on straights, 1 at the sharpest bend)
+        curvature = np.zeros(n, dtype=np.float32)
+        curvature[1:-1] = np.linalg.norm(pts[:-2] - 2 * pts[1:-1] + pts[2:], axis=1)
+        peak = curvature.max()
+        if peak > 0:
+            curvature /= peak
+        
+        spacing = sparse_factor * mean_segment / (1.0 + alpha * curvature)
+        
+        keep = [0]
+        travelled = 0.0
+        for i in range(1, n - 1):
+            travelled += segment[i - 1]
+            if travelled >= spacing[i]:
+                keep.append(i)
+                travelled = 0.0
+        keep.append(n - 1)
+        
+        return pts[keep]
+    
+    def create_curve_pipeline(self):
+        """Create the tube and marker actors of the 3D curve once"""
+        path_polydata = vtk.vtkPolyData()
         
-        # Create cell array
-        cells = vtk.vtkCellArray()
-        cells.InsertNextCell(polyline)
-        
-        # Create polydata
-        polydata = vtk.vtkPolyData()
-        polydata.SetPoints(points)
-        polydata.SetLines(cells)
-        
-        # Create tube filter for better visibility
-        tube = vtk.vtkTubeFilter()
-        tube.SetInputData(polydata)
-        tube.SetRadius(1.0)
-        tube.SetNumberOfSides(12)
-        tube.CappingOn()
-        tube.Update()
-        
-        # Create mapper and actor
+        # Raw polyline, shaded as a tube on the GPU (fixed 4 px on screen)
         mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputConnection(tube.GetOutputPort())
+        mapper.SetInputData(path_polydata)
         
         actor = vtk.vtkActor()
         actor.SetMapper(mapper)
         actor.GetProperty().SetColor(1.0, 1.0, 0.0)  # Yellow
         actor.GetProperty().SetOpacity(0.8)
-        
-        self.renderer.AddActor(actor)
-        self.curved_mpr_actors.append(actor)
-        
-        # Add spheres at curve points
-        for x, y, z in curve_points[::10]:  # Every 10th point
-            sphere = vtk.vtkSphereSource()
-            
-            if self.ct_spacing and self.ct_origin:
-                wx = x * self.ct_spacing[0] + self.ct_origin[0]
-                wy = y * self.ct_spacing[1] + self.ct_origin[1]
-                wz = z * self.ct_spacing[2] + self.ct_origin[2]
-                sphere.SetCenter(wx, wy, wz)
-            else:
-                sphere.SetCenter(x, y, z)
-            
-            sphere.SetRadius(3.0)
-            sphere.Update()
-            
-            sphere_mapper = vtk.vtkPolyDataMapper()
-            sphere_mapper.SetInputConnection(sphere.GetOutputPort())
-            
-            sphere_actor = vtk.vtkActor()
-            sphere_actor.SetMapper(sphere_mapper)
-            sphere_actor.GetProperty().SetColor(1.0, 0.0, 0.0)  # Red
-            
-            self.renderer.AddActor(sphere_actor)
-            self.curved_mpr_actors.append(sphere_actor)
+        actor.GetProperty().SetRenderLinesAsTubes(True)
+        actor.GetProperty().SetLineWidth(4)
+        
+        # Markers: one glyph actor instead of an actor per sphere
+        marker_polydata = vtk.vtkPolyData()
+        sphere = vtk.vtkSphereSource()
+        sphere.SetRadius(3.0)
+        sphere.SetPhiResolution(8)
+        sphere.SetThetaResolution(8)
+        
+        # Glyphs are placed from the points alone - no vertex cells needed
+        marker_mapper = vtk.vtkGlyph3DMapper()
+        marker_mapper.SetInputData(marker_polydata)
+        marker_mapper.SetSourceConnection(sphere.GetOutputPort())
+        marker_mapper.ScalingOff()
+        marker_mapper.OrientOff()
+        
+        marker_actor = vtk.vtkActor()
+        marker_actor.SetMapper(marker_mapper)
+        marker_actor.GetProperty().SetColor(1.0, 0.0, 0.0)  # Red
+        
+        # One prop in the renderer: clearing the curve removes a single assembly
+        assembly = vtk.vtkAssembly()
+        assembly.AddPart(actor)
+        assembly.AddPart(marker_actor)
+        self.renderer.AddActor(assembly)
+        self.curved_mpr_actors = [assembly]
+        
+        return path_polydata, marker_polydata
+    
+    def to_vtk_points(self, coords):
+        """Copy an (N, 3) array into a new vtkPoints with a single memcpy"""
+        points = vtk.vtkPoints()
+        points.SetDataTypeToFloat()
+        points.SetNumberOfPoints(len(coords))
+        if NUMPY_SUPPORT_AVAILABLE:
+            numpy_support.vtk_to_numpy(points.GetData())[:] = coords
+        else:
+            for i, (x, y, z) in enumerate(coords):
+                points.SetPoint(i, x, y, z)
+        return points
+    
+    def polyline_cells(self, n):
+        """Cell array holding one polyline through points 0..n-1"""
+        cells = vtk.vtkCellArray()
+        if NUMPY_SUPPORT_AVAILABLE:
+            # Offsets/connectivity filled from NumPy instead of n SetId calls
+            id_type = numpy_support.ID_TYPE_CODE
+            cells.SetData(
+                numpy_support.numpy_to_vtkIdTypeArray(np.array([0, n], dtype=id_type), deep=True),
+                numpy_support.numpy_to_vtkIdTypeArray(np.arange(n, dtype=id_type), deep=True))
+        else:
+            # Fill the cell directly, without a temporary vtkPolyLine
+            cells.InsertNextCell(n)
+            for i in range(n):
+                cells.InsertCellPoint(i)
+        return cells
     
     # ========== CINE MODE ==========
     
@@ -844,7 +1551,9 @@ class IntegratedMPRViewer(QWidget):
         # Start/stop timer
         if self.is_playing_z or self.is_playing_y or self.is_playing_x:
             if not self.cine_timer.isActive():
-                self.cine_timer.start(50)  # 20 FPS
+                self._frame_in_flight = False
+                self._cine_clock.start()
+                self.cine_timer.start(_CINE_FRAME_MS)
         else:
             self.cine_timer.stop()
     
@@ -853,25 +1562,75 @@ class IntegratedMPRViewer(QWidget):
         if self.scan_array is None:
             return
         
+        # Wait until the previous frame is on screen
+        if self._frame_in_flight:
+            return
+        
+        # Skip the slices whose frames a slow render missed (rounded, so
+        # timer jitter around one interval still advances a single slice)
+        elapsed = self._cine_clock.restart()
+        steps = max(1, (elapsed + _CINE_FRAME_MS // 2) // _CINE_FRAME_MS)
+        
+        # Advance without per-slider signals; one redraw follows
+        sliders = (self.axial_slider, self.coronal_slider, self.sagittal_slider)
+        for slider in sliders:
+            slider.blockSignals(True)
+        
         if self.is_playing_z:
             val = self.axial_slider.value()
             max_val = self.axial_slider.maximum()
-            self.axial_slider.setValue(0 if val >= max_val else val + 1)
+            self.crosshair_z = (val + steps) % (max_val + 1)
+            self.axial_slider.setValue(self.crosshair_z)
+            self.axial_label.setText(str(self.crosshair_z))
         
         if self.is_playing_y:
             val = self.coronal_slider.value()
             max_val = self.coronal_slider.maximum()
-            self.coronal_slider.setValue(0 if val >= max_val else val + 1)
+            self.crosshair_y = (val + steps) % (max_val + 1)
+            self.coronal_slider.setValue(self.crosshair_y)
+            self.coronal_label.setText(str(self.crosshair_y))
         
         if self.is_playing_x:
             val = self.sagittal_slider.value()
             max_val = self.sagittal_slider.maximum()
-            self.sagittal_slider.setValue(0 if val >= max_val else val + 1)
+            self.crosshair_x = (val + steps) % (max_val + 1)
+            self.sagittal_slider.setValue(self.crosshair_x)
+            self.sagittal_label.setText(str(self.crosshair_x))
+        
+        for slider in sliders:
+            slider.blockSignals(False)
+        
+        # Redraw now so cine keeps its frame rate
+        self._frame_in_flight = True
+        self._redraw_timer.stop()
+        self._do_update_all_views()
+        
+        # Queued behind the canvases' deferred draws, so it runs once they finish
+        QTimer.singleShot(0, self._cine_frame_presented)
+    
+    def _cine_frame_presented(self):
+        """Allow the next cine advance"""
+        self._frame_in_flight = False
     
     def clear(self):
         """Clear all data"""
+        # The worker reads the volume - finish/abandon it first
+        self.stop_curve_worker()
+        
         self.scan_array = None
+        self.scan_f32 = None
+        self._mpr_buffer = None
+        self._d_vol = None
+        self._coronal = None
+        self._sagittal = None
+        self._reslicers = {}
+        self._vtk_volume = None
+        self._slice_cache.clear()
         self.itk_image = None
+        self.ct_spacing = None
+        self.ct_origin = None
+        self._spacing_f32 = None
+        self._origin_f32 = None
         self.curved_mpr_points = []
         self.curved_mpr_slices = []
         
@@ -879,16 +1638,26 @@ class IntegratedMPRViewer(QWidget):
         for actor in self.curved_mpr_actors:
             self.renderer.RemoveActor(actor)
         self.curved_mpr_actors = []
+        self._curve_pipeline = None
         
         # Stop cine
         if self.cine_timer.isActive():
             self.cine_timer.stop()
+        self._redraw_timer.stop()
         
-        # Clear views
-        for ax, canvas in [(self.axial_ax, self.axial_canvas),
-                          (self.coronal_ax, self.coronal_canvas),
-                          (self.sagittal_ax, self.sagittal_canvas),
-                          (self.curved_ax, self.curved_canvas)]:
-            ax.clear()
-            ax.axis('off')
-            canvas.draw_idle()
\ No newline at end of file
+        # Clear views - blank the persistent artists instead of rebuilding axes
+        for view in ['axial', 'coronal', 'sagittal']:
+            if self._initialized.get(view):
+                self.reset_view_artists(view)
+                getattr(self, f'{view}_canvas').draw_idle()
+        if self.curved_ax is not None:
+            for image in self.curved_ax.images:
+                image.set_data(np.zeros((1, 1), dtype=np.uint8))
+            self.curved_canvas.draw_idle()
+        self._bg = {}
+        self._view_state = {}
+        
+        if PYQTGRAPH_AVAILABLE:
+            for view in ['axial', 'coronal', 'sagittal']:
+                getattr(self, f'{view}_img').clear()
+                getattr(self, f'{view}_curve').setData([], [])
\ No newline at end of file
@@ -3,27 +3,35 @@ Professional Main Window with Integrated MPR Viewer - FIXED
 Enhanced GUI with neon accents, scrolling, and integrated MPR tab
 """
 
-import vtk
+from functools import partial
+
+# Only the VTK classes this window uses, instead of the whole `vtk` package
+from vtkmodules.vtkCommonDataModel import vtkBoundingBox
+from vtkmodules.vtkRenderingCore import vtkActor, vtkPolyDataMapper, vtkRenderer
+from vtkmodules.vtkRenderingLOD import vtkLODActor
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+import vtkmodules.vtkRenderingOpenGL2  # Registers the OpenGL render window/mapper overrides
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QComboBox, QPushButton, QSlider, QCheckBox,
                              QGroupBox, QTabWidget, QSplitter, QScrollArea,
                              QFileDialog, QButtonGroup, QRadioButton, QMessageBox,
-                             QProgressDialog, QFrame, QListWidget, QAbstractItemView,
+                             QProgressDialog, QFrame, QListView, QAbstractItemView,
                              QGridLayout) # <--- 1. إضافة QGridLayout
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QStringListModel
 from PyQt5.QtGui import QFont
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 
 from model_loader import ModelLoader
-from unified_navigation import FocusNavigationManager, FlythroughManager, VirtualEndoscopyManager
-from unified_visualization import ClippingManager, CurvedMPRManager
-from visualization.integrated_mpr_ct_viewer import IntegratedMPRViewer
-# After line 23 (after other imports from visualization)
-from unified_visualization import ClippingManager, CurvedMPRManager, InteractiveMPRManager
-from navigation.animations import AnimationManager
-from config import (ORGAN_CONFIGS, BACKGROUND_COLOR, get_color_for_part, get_color_for_label,
-                    get_color_for_part_hsv, get_color_for_part_pure_hsv, generate_hsv_colors,
-                    print_hsv_color_map)
+# The navigation, visualization, animation and MPR viewer modules are
+# imported where they are first needed, so the window shows without them
+from config import ORGAN_CONFIGS, BACKGROUND_COLOR, get_color_for_part
+
+# Scenes with more parts than this use LOD actors, which drop to point
+# clouds while the camera moves (see create_3d_view's update rates)
+LOD_PART_THRESHOLD = 50
+
+# (display name, organ key) for the system selector, built once at import
+_ORGAN_ITEMS = tuple((config['name'], organ_key) for organ_key, config in ORGAN_CONFIGS.items())
 
 
 def set_button_style(self, button, style='primary'):
@@ -52,7 +60,7 @@ class MedicalVisualizationWindow(QMainWindow):
         
         self.virtual_endoscopy = None
         # Initialize VTK components
-        self.renderer = vtk.vtkRenderer()
+        self.renderer = vtkRenderer()
         self.renderer.SetBackground(*BACKGROUND_COLOR)
         
         # Initialize managers
@@ -76,6 +84,28 @@ class MedicalVisualizationWindow(QMainWindow):
         self.actors = {}
         self.mappers = {}
         self.part_checkboxes = {}
+        self._label_values = {}  # Last percentage shown per slider label
+        
+        # Coalesces clipping slider drags into one render per frame (~60 Hz)
+        self._clip_render_timer = QTimer(self)
+        self._clip_render_timer.setSingleShot(True)
+        self._clip_render_timer.setInterval(16)
+        self._clip_render_timer.timeout.connect(self.render_clipping_update)
+        
+        # Coalesces opacity/visibility changes made in one event loop pass
+        # into a single render once the loop is idle
+        self._render_dirty_timer = QTimer(self)
+        self._render_dirty_timer.setSingleShot(True)
+        self._render_dirty_timer.setInterval(0)
+        self._render_dirty_timer.timeout.connect(self.render_scene)
+        
+        # Status messages are shown at most every 50 ms; only the latest counts
+        self._status_pending = None
+        self._status_error = None  # Error state the label is currently styled for
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
         
         # Setup UI
         self.setup_ui()
@@ -213,8 +243,9 @@ class MedicalVisualizationWindow(QMainWindow):
         self.organ_selector = QComboBox()
         self.organ_selector.setObjectName("organSelector")
         self.organ_selector.addItem("Select System")
-        for organ_key, config in ORGAN_CONFIGS.items():
-            self.organ_selector.addItem(config['name'], organ_key)
+        self.organ_selector.addItems([name for name, _ in _ORGAN_ITEMS])
+        for index, (_, organ_key) in enumerate(_ORGAN_ITEMS, start=1):
+            self.organ_selector.setItemData(index, organ_key)
         data_layout.addWidget(self.organ_selector)
         
         mode_label = QLabel("📊 Data Type:")
@@ -300,26 +331,31 @@ class MedicalVisualizationWindow(QMainWindow):
         visibility_instructions.setStyleSheet("color: #888888; font-style: italic; font-size: 8pt;")
         visibility_layout.addWidget(visibility_instructions)
 
-        self.visibility_list_widget = QListWidget()
+        # Part names live in a string model; selection changes arrive as
+        # (selected, deselected) ranges so only those parts are touched
+        self.visibility_model = QStringListModel()
+        self.visibility_list_widget = QListView()
+        self.visibility_list_widget.setModel(self.visibility_model)
+        self.visibility_list_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.visibility_list_widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.visibility_list_widget.setStyleSheet("""
-            QListWidget { 
+            QListView { 
                 background-color: #1a1a1a; 
                 border: 1px solid #333; 
                 border-radius: 5px;
                 padding: 5px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #0078d4  ; /* مختار = ظاهر */
                 color: #0a0a0a;
             }
-            QListWidget::item {
+            QListView::item {
                 background-color: #333; /* غير مختار = مخفي */
                 color: #888;
                 border-bottom: 1px solid #222;
             }
         """)
-        self.visibility_list_widget.itemSelectionChanged.connect(self.apply_visibility_logic)
+        self.visibility_list_widget.selectionModel().selectionChanged.connect(self.apply_visibility_logic)
         visibility_layout.addWidget(self.visibility_list_widget)
 
         visibility_buttons = QHBoxLayout()
@@ -406,8 +442,9 @@ class MedicalVisualizationWindow(QMainWindow):
             slider.setMinimum(0)
             slider.setMaximum(100)
             slider.setValue(50)
-            slider.sliderMoved.connect(lambda value, lbl=label, ax=axis: 
-                                        self.update_simple_clipping(ax, 'slider', value, lbl))
+            # partial binds the axis/label without an extra Python frame per event
+            slider.sliderMoved.connect(partial(self.update_simple_clipping, axis, 'slider',
+                                               label=label))
             slider.sliderReleased.connect(self.render_clipping_update)
 
         for check, axis in [
@@ -415,8 +452,7 @@ class MedicalVisualizationWindow(QMainWindow):
             (self.clip_y_check, 'y'),
             (self.clip_z_check, 'z')
         ]:
-            check.stateChanged.connect(lambda state, ax=axis: 
-                                        self.update_simple_clipping(ax, 'check', state))
+            check.stateChanged.connect(partial(self.update_simple_clipping, axis, 'check'))
 
         self.simple_clipping_group.setLayout(simple_layout)
         layout.addWidget(self.simple_clipping_group)
@@ -469,8 +505,9 @@ class MedicalVisualizationWindow(QMainWindow):
             slider.setMinimum(0)
             slider.setMaximum(100)
             slider.setValue(50)
-            slider.sliderMoved.connect(lambda value, lbl=label, ax=axis: 
-                                        self.update_mpr_clipping(ax, 'slider', value, lbl))
+            # partial binds the axis/label without an extra Python frame per event
+            slider.sliderMoved.connect(partial(self.update_mpr_clipping, axis, 'slider',
+                                               label=label))
             slider.sliderReleased.connect(self.render_clipping_update)
 
         for check, axis in [
@@ -478,8 +515,7 @@ class MedicalVisualizationWindow(QMainWindow):
             (self.mpr_y_check, 'y'),
             (self.mpr_z_check, 'z')
         ]:
-            check.stateChanged.connect(lambda state, ax=axis: 
-                                        self.update_mpr_clipping(ax, 'check', state))
+            check.stateChanged.connect(partial(self.update_mpr_clipping, axis, 'check'))
 
         self.mpr_clipping_group.setLayout(mpr_layout)
         layout.addWidget(self.mpr_clipping_group)
@@ -516,28 +552,31 @@ class MedicalVisualizationWindow(QMainWindow):
         focus_layout.addWidget(focus_part_label)
 
         # --- (BEGIN ADDED WIDGETS) ---
-        self.opacity_list_widget = QListWidget()
+        self.opacity_model = QStringListModel()
+        self.opacity_list_widget = QListView()
+        self.opacity_list_widget.setModel(self.opacity_model)
+        self.opacity_list_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.opacity_list_widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
         # (استعارة الـ style من قائمة الإظهار لتوحيد الشكل)
         self.opacity_list_widget.setStyleSheet("""
-            QListWidget { 
+            QListView { 
                 background-color: #1a1a1a; 
                 border: 1px solid #333; 
                 border-radius: 5px;
                 padding: 5px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #0078d4; /* مختار = سيصبح شفاف */
                 color: #0a0a0a;
             }
-            QListWidget::item {
+            QListView::item {
                 background-color: #333; /* غير مختار = سيظل واضح */
                 color: #888;
                 border-bottom: 1px solid #222;
             }
         """)
         # ربط التغيير في الاختيار بالدالة المنطقية
-        self.opacity_list_widget.itemSelectionChanged.connect(self.apply_opacity_logic)
+        self.opacity_list_widget.selectionModel().selectionChanged.connect(self.apply_opacity_logic)
         focus_layout.addWidget(self.opacity_list_widget)
 
         self.selected_parts_label = QLabel("Selected: None")
@@ -822,6 +861,7 @@ class MedicalVisualizationWindow(QMainWindow):
     def start_virtual_endoscopy(self):
         """Start automatic virtual endoscopy"""
         if not self.virtual_endoscopy:
+            from unified_navigation import VirtualEndoscopyManager
             self.virtual_endoscopy = VirtualEndoscopyManager(self.renderer, self.model_loader)
         
         speed = self.flythrough_speed.value()
@@ -915,9 +955,13 @@ class MedicalVisualizationWindow(QMainWindow):
         render_window.AddRenderer(self.renderer)
         
         self.interactor = self.vtk_widget.GetRenderWindow().GetInteractor()
-        style = vtk.vtkInteractorStyleTrackballCamera()
+        style = vtkInteractorStyleTrackballCamera()
         self.interactor.SetInteractorStyle(style)
         
+        # Trade quality for frame rate while interacting; full quality when still
+        self.interactor.SetDesiredUpdateRate(15.0)
+        self.interactor.SetStillUpdateRate(0.5)
+        
         
         return widget
     
@@ -1137,6 +1181,7 @@ class MedicalVisualizationWindow(QMainWindow):
         
         if not self.mpr_viewer:
             mpr_layout = self.mpr_tab_widget.layout()
+            from visualization.integrated_mpr_ct_viewer import IntegratedMPRViewer
             self.mpr_viewer = IntegratedMPRViewer(self.renderer, self.model_loader, self.mpr_tab_widget)
             
             if self.mpr_viewer.load_ct_from_model_loader():
@@ -1168,13 +1213,19 @@ class MedicalVisualizationWindow(QMainWindow):
         print(f"Creating Actors with ANATOMICAL Coloring for: {organ_key}")
         print(f"{'='*70}")
         
+        # Large scenes: LOD actors keep camera interaction at the desired rate
+        actor_class = vtkLODActor if len(models) > LOD_PART_THRESHOLD else vtkActor
+        
         for part_name, polydata in models.items():
             # Create mapper
-            mapper = vtk.vtkPolyDataMapper()
+            mapper = vtkPolyDataMapper()
             mapper.SetInputData(polydata)
+            # Part meshes never change after loading: skip the per-render
+            # pipeline update check that every mapper would otherwise run
+            mapper.StaticOn()
             
             # Create actor
-            actor = vtk.vtkActor()
+            actor = actor_class()
             actor.SetMapper(mapper)
             
             # Get anatomically appropriate color
@@ -1217,7 +1268,7 @@ class MedicalVisualizationWindow(QMainWindow):
             return [0, 0, 0, 0, 0, 0]
         
         # (تم الإصلاح 1) استخدام "vtkBoundingBox" الصحيح
-        all_bounds = vtk.vtkBoundingBox()
+        all_bounds = vtkBoundingBox()
         
         for actor in self.actors.values():
             actor_bounds = actor.GetBounds()
@@ -1246,6 +1297,11 @@ class MedicalVisualizationWindow(QMainWindow):
 
     def initialize_managers(self):
         """Initialize all managers"""
+        from unified_visualization import ClippingManager
+        from unified_navigation import (FocusNavigationManager, FlythroughManager,
+                                        VirtualEndoscopyManager)
+        from navigation.animations import AnimationManager
+        
         self.clipping_manager = ClippingManager()
         self.clipping_manager.set_actors(self.actors)
         
@@ -1263,7 +1319,6 @@ class MedicalVisualizationWindow(QMainWindow):
         self.virtual_endoscopy = VirtualEndoscopyManager(self.renderer, self.model_loader)
         
         # Initialize the manual flythrough manager using FlythroughManager
-        from unified_navigation import FlythroughManager
         self.flythrough_manager = FlythroughManager(self.renderer, self.current_organ)
         
         self.update_animation_types()
@@ -1274,7 +1329,7 @@ class MedicalVisualizationWindow(QMainWindow):
         enabled = (state == 2)
         for actor in self.actors.values():
             actor.SetVisibility(enabled)
-        self.vtk_widget.GetRenderWindow().Render()
+        self.schedule_render()
     
     # <!-- (بداية الحذف) -->
     # <!-- تم حذف الدوال القديمة الخاصة بالـ Clipping -->
@@ -1310,7 +1365,7 @@ class MedicalVisualizationWindow(QMainWindow):
         if sender_type == 'slider':
             position = value
             if label:
-                label.setText(f"{position}%") # تحديث النسبة (0-100)
+                self.set_percent_label(label, position) # تحديث النسبة (0-100)
         else: # sender_type == 'check'
             position = current_pos
             is_enabled = (value == 2) # (2 == Qt.Checked)
@@ -1320,10 +1375,31 @@ class MedicalVisualizationWindow(QMainWindow):
         
         # 4. تحديث الـ Render (فقط عند تحريك الـ Slider)
         if sender_type == 'slider':
-            self.vtk_widget.GetRenderWindow().Render()
+            self.schedule_clipping_render()
+
+    def schedule_render(self):
+        """Render once the event loop is idle; repeated calls before then share it."""
+        self._render_dirty_timer.start()
+
+    def render_scene(self):
+        """Render the 3D view now."""
+        self.vtk_widget.GetRenderWindow().Render()
+
+    def set_percent_label(self, label, value):
+        """Show a slider percentage, skipping the Qt update when it is unchanged."""
+        if self._label_values.get(label) == value:
+            return
+        self._label_values[label] = value
+        label.setText(f"{value}%")
+
+    def schedule_clipping_render(self):
+        """Render within one frame; further drag events until then share that render."""
+        if not self._clip_render_timer.isActive():
+            self._clip_render_timer.start()
 
     def render_clipping_update(self):
-        """Called when slider is released to ensure final render."""
+        """Render pending clipping changes (slider release or the drag timer)."""
+        self._clip_render_timer.stop()
         self.vtk_widget.GetRenderWindow().Render()
     
     def switch_clipping_mode(self):
@@ -1385,7 +1461,7 @@ class MedicalVisualizationWindow(QMainWindow):
         if sender_type == 'slider':
             position = value
             if label:
-                label.setText(f"{position}%")
+                self.set_percent_label(label, position)
         else:  # check
             position = current_pos
             is_enabled = (value == 2)
@@ -1394,7 +1470,7 @@ class MedicalVisualizationWindow(QMainWindow):
         self.clipping_manager.update_plane_state(axis, is_enabled, position)
         
         if sender_type == 'slider':
-            self.vtk_widget.GetRenderWindow().Render()
+            self.schedule_clipping_render()
 
     def update_mpr_clipping(self, axis, sender_type, value, label=None):
         """Update MPR plane widgets"""
@@ -1418,7 +1494,7 @@ class MedicalVisualizationWindow(QMainWindow):
         if sender_type == 'slider':
             position = value
             if label:
-                label.setText(f"{position}%")
+                self.set_percent_label(label, position)
         else:  # check
             position = current_pos
             is_enabled = (value == 2)
@@ -1427,9 +1503,12 @@ class MedicalVisualizationWindow(QMainWindow):
         print(f"[Main] Updating MPR {axis} plane: enabled={is_enabled}, position={position}%")
         self.mpr_manager.update_plane_state(axis, is_enabled, position)
         
-        # Force render
-        self.interactor.Render()
-        self.vtk_widget.GetRenderWindow().Render()
+        # Drags render at most once per frame; toggles render immediately
+        if sender_type == 'slider':
+            self.schedule_clipping_render()
+        else:
+            self.interactor.Render()
+            self.vtk_widget.GetRenderWindow().Render()
         
         # Update status
         plane_name = {'x': 'Sagittal', 'y': 'Coronal', 'z': 'Axial'}[axis]
@@ -1493,7 +1572,7 @@ class MedicalVisualizationWindow(QMainWindow):
     # --- التعديل: تطبيق المنطق العكسي للشفافية ---
     # -----------------------------------------------------------------
     
-    def apply_opacity_logic(self):
+    def apply_opacity_logic(self, selected=None, deselected=None):
         """
         Applies opacity to *selected* items, leaving others at 100%.
         This is the new "reversed" logic requested by the user.
@@ -1503,8 +1582,8 @@ class MedicalVisualizationWindow(QMainWindow):
 
         try:
             # 1. Get all selected part names from the list
-            selected_items = self.opacity_list_widget.selectedItems()
-            selected_part_names = {item.text() for item in selected_items} # Use a set for faster lookup
+            selected_indexes = self.opacity_list_widget.selectionModel().selectedIndexes()
+            selected_part_names = {index.data() for index in selected_indexes} # Use a set for faster lookup
             
             # 2. Get the opacity value from the slider
             selected_opacity = self.transparency_slider.value() / 100.0
@@ -1538,8 +1617,8 @@ class MedicalVisualizationWindow(QMainWindow):
                 self.selected_parts_label.setText("Selected: None (All Visible)")
                 self.update_status("Opacity reset. All parts visible.")
 
-            # 6. Render the result
-            self.vtk_widget.GetRenderWindow().Render()
+            # 6. Render the result (deferred until the event loop is idle)
+            self.schedule_render()
             
         except Exception as e:
             # أي خطأ آخر
@@ -1551,7 +1630,7 @@ class MedicalVisualizationWindow(QMainWindow):
 
 
     def clear_opacity_selection(self):
-        """Clears the selection in the QListWidget."""
+        """Clears the selection in the opacity list."""
         # <!-- (تم التعديل) التأكد من أننا نمسح القائمة الصحيحة -->
         self.opacity_list_widget.clearSelection()
     
@@ -1567,41 +1646,54 @@ class MedicalVisualizationWindow(QMainWindow):
     # --- (بداية الإضافة: المهمة رقم 2) ---
     # --- دوال التحكم في الإظهار (Visibility) ---
     
-    def apply_visibility_logic(self):
+    def apply_visibility_logic(self, selected=None, deselected=None):
         """
         Applies visibility based on the visibility_list_widget.
         Selected items = Visible. Deselected items = Hidden.
+        
+        Args:
+            selected: Newly selected rows (QItemSelection) from selectionChanged
+            deselected: Newly deselected rows; without both, all parts are checked
         """
         if not self.actors:
             return
 
-        # 1. Get all selected part names from the visibility list
-        selected_items = self.visibility_list_widget.selectedItems()
-        selected_part_names = {item.text() for item in selected_items} # Use a set for faster lookup
+        if selected is None or deselected is None:
+            # 1. Full pass: every part against the current selection
+            selected_indexes = self.visibility_list_widget.selectionModel().selectedIndexes()
+            selected_part_names = {index.data() for index in selected_indexes} # Use a set for faster lookup
+            targets = ((actor, part_name in selected_part_names)
+                       for part_name, actor in self.actors.items())
+        else:
+            # 1. Delta: only the rows whose selection just changed
+            targets = ([(self.actors.get(index.data()), True) for index in selected.indexes()] +
+                       [(self.actors.get(index.data()), False) for index in deselected.indexes()])
+        
+        # 2. Touch only the actors whose visibility actually changes
+        # (selected -> shown, deselected -> hidden)
+        changed = [(actor, visible) for actor, visible in targets
+                   if actor is not None and bool(actor.GetVisibility()) != visible]
+        if not changed:
+            return
         
-        # 2. Loop through ALL actors
-        for part_name, actor in self.actors.items():
-            if part_name in selected_part_names:
-                # This part IS selected -> Show it
-                actor.SetVisibility(True)
-            else:
-                # This part is NOT selected -> Hide it
-                actor.SetVisibility(False)
+        for actor, visible in changed:
+            actor.SetVisibility(visible)
         
-        self.vtk_widget.GetRenderWindow().Render()
+        self.schedule_render()
 
     def show_all_parts(self):
         """Selects all items in the visibility list, making all parts visible."""
         # Stop listening to signals temporarily
+        selection_model = self.visibility_list_widget.selectionModel()
         try:
-            self.visibility_list_widget.itemSelectionChanged.disconnect(self.apply_visibility_logic)
+            selection_model.selectionChanged.disconnect(self.apply_visibility_logic)
         except TypeError:
             pass # (إصلاح الـ Crash) تجاهل الخطأ إذا لم يكن متصلاً
         
         self.visibility_list_widget.selectAll()
         
         # Reconnect signals
-        self.visibility_list_widget.itemSelectionChanged.connect(self.apply_visibility_logic)
+        selection_model.selectionChanged.connect(self.apply_visibility_logic)
         
         # Apply the logic manually once
         self.apply_visibility_logic()
@@ -1610,15 +1702,16 @@ class MedicalVisualizationWindow(QMainWindow):
     def hide_all_parts(self):
         """Deselects all items in the visibility list, hiding all parts."""
         # Stop listening to signals temporarily
+        selection_model = self.visibility_list_widget.selectionModel()
         try:
-            self.visibility_list_widget.itemSelectionChanged.disconnect(self.apply_visibility_logic)
+            selection_model.selectionChanged.disconnect(self.apply_visibility_logic)
         except TypeError:
             pass # (إصلاح الـ Crash) تجاهل الخطأ إذا لم يكن متصلاً
         
         self.visibility_list_widget.clearSelection()
         
         # Reconnect signals
-        self.visibility_list_widget.itemSelectionChanged.connect(self.apply_visibility_logic)
+        selection_model.selectionChanged.connect(self.apply_visibility_logic)
         
         # Apply the logic manually once
         self.apply_visibility_logic()
@@ -1814,26 +1907,24 @@ class MedicalVisualizationWindow(QMainWindow):
 
         # 1. Populate Opacity List (in Navigation tab)
         if hasattr(self, 'opacity_list_widget'):
+            selection_model = self.opacity_list_widget.selectionModel()
             try:
-                self.opacity_list_widget.itemSelectionChanged.disconnect(self.apply_opacity_logic)
+                selection_model.selectionChanged.disconnect(self.apply_opacity_logic)
             except TypeError:
                 pass
-            
-            self.opacity_list_widget.clear()
-            self.opacity_list_widget.addItems(all_parts)
-            self.opacity_list_widget.itemSelectionChanged.connect(self.apply_opacity_logic)
+            self.opacity_model.setStringList(all_parts)
+            selection_model.selectionChanged.connect(self.apply_opacity_logic)
         
         # 2. Populate Visibility List (in Visualization tab)
         if hasattr(self, 'visibility_list_widget'):
+            selection_model = self.visibility_list_widget.selectionModel()
             try:
-                self.visibility_list_widget.itemSelectionChanged.disconnect(self.apply_visibility_logic)
+                selection_model.selectionChanged.disconnect(self.apply_visibility_logic)
             except TypeError:
                 pass
-                
-            self.visibility_list_widget.clear()
-            self.visibility_list_widget.addItems(all_parts)
+            self.visibility_model.setStringList(all_parts)
             self.visibility_list_widget.selectAll()
-            self.visibility_list_widget.itemSelectionChanged.connect(self.apply_visibility_logic)
+            selection_model.selectionChanged.connect(self.apply_visibility_logic)
         
        
    
@@ -1892,20 +1983,22 @@ class MedicalVisualizationWindow(QMainWindow):
         
         # Clear the part lists
         if hasattr(self, 'opacity_list_widget'):
+            selection_model = self.opacity_list_widget.selectionModel()
             try:
-                self.opacity_list_widget.itemSelectionChanged.disconnect(self.apply_opacity_logic)
+                selection_model.selectionChanged.disconnect(self.apply_opacity_logic)
             except TypeError:
                 pass
-            self.opacity_list_widget.clear()
-            self.opacity_list_widget.itemSelectionChanged.connect(self.apply_opacity_logic)
+            self.opacity_model.setStringList([])
+            selection_model.selectionChanged.connect(self.apply_opacity_logic)
         
         if hasattr(self, 'visibility_list_widget'):
+            selection_model = self.visibility_list_widget.selectionModel()
             try:
-                self.visibility_list_widget.itemSelectionChanged.disconnect(self.apply_visibility_logic)
+                selection_model.selectionChanged.disconnect(self.apply_visibility_logic)
             except TypeError:
                 pass
-            self.visibility_list_widget.clear()
-            self.visibility_list_widget.itemSelectionChanged.connect(self.apply_visibility_logic)
+            self.visibility_model.setStringList([])
+            selection_model.selectionChanged.connect(self.apply_visibility_logic)
         # ADD before self.vtk_widget.GetRenderWindow().Render() in clear_scene
         if self.mpr_manager:
             self.mpr_manager.remove_all_planes()
@@ -1979,14 +2072,36 @@ class MedicalVisualizationWindow(QMainWindow):
             self.render_timer.stop()
     
     def update_render(self):
+        # Fly-throughs move the camera every tick; animations only need a
+        # frame when they changed something since the last one
+        camera_moving = (
+            (self.flythrough_manager and self.flythrough_manager.is_running()) or
+            (self.virtual_endoscopy and self.virtual_endoscopy.is_running())
+        )
+        if (not camera_moving and self.animation_manager and
+                not self.animation_manager.take_render_request()):
+            return
         self.vtk_widget.GetRenderWindow().Render()
     
     def update_status(self, message, error=False):
+        self._status_pending = (message, error)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status(self):
+        """Show the latest pending status; restyle only when the error state flips"""
+        if self._status_pending is None:
+            return
+        message, error = self._status_pending
+        self._status_pending = None
+        
         self.status_label.setText(message)
-        if error:
-            self.status_label.setStyleSheet("QLabel#statusLabel { color: #ff4444; }")
-        else:
-            self.status_label.setStyleSheet("QLabel#statusLabel { color: #0078d4  ; }")
+        if error != self._status_error:
+            self._status_error = error
+            if error:
+                self.status_label.setStyleSheet("QLabel#statusLabel { color: #ff4444; }")
+            else:
+                self.status_label.setStyleSheet("QLabel#statusLabel { color: #0078d4  ; }")
     
     def apply_professional_theme(self):
         """Apply modern professional theme with enhanced styling"""
@@ -2183,6 +2298,7 @@ class MedicalVisualizationWindow(QMainWindow):
     def toggle_manual_waypoint_mode(self, checked):
         """Toggle manual waypoint placement mode"""
         if not self.virtual_endoscopy:
+            from unified_navigation import VirtualEndoscopyManager
             self.virtual_endoscopy = VirtualEndoscopyManager(self.renderer, self.model_loader)
         
         if checked:
@@ -27,7 +27,6 @@ except ImportError:
     SCIPY_AVAILABLE = False
     print("Warning: SciPy not available. Advanced mask cleaning disabled.")
 
-from config import get_color_for_part, get_color_for_label
 
 def _clean_part_name(filename):
     """
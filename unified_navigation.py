@@ -77,7 +77,9 @@ class FlythroughManager:
     def __init__(self, renderer, organ_type):
         self.renderer = renderer
         self.organ_type = organ_type
-        self.flythrough_timer = None
+        # One timer for every run: started and stopped, never recreated
+        self.flythrough_timer = QTimer()
+        self.flythrough_timer.timeout.connect(self.update_flythrough)
         self.flythrough_path = []
         self.flythrough_index = 0
         self.speed = 1.0
@@ -85,16 +87,48 @@ class FlythroughManager:
         # Manual path creation
         self.manual_points = []
         self.point_sphere_actors = []
-        self.path_line_actor = None
         self.is_picking_mode = False
+        
+        # One sphere mesh shared by every picked-point marker
+        self._sphere_source = vtk.vtkSphereSource()
+        self._sphere_source.SetRadius(2.0)
+        self._sphere_source.SetThetaResolution(16)
+        self._sphere_source.SetPhiResolution(16)
+        self._sphere_mapper = vtk.vtkPolyDataMapper()
+        self._sphere_mapper.SetInputConnection(self._sphere_source.GetOutputPort())
+        
+        # Path line through the picked points, grown in place on each pick
+        self._path_points = vtk.vtkPoints()
+        self._path_lines = vtk.vtkCellArray()
+        self._path_polydata = vtk.vtkPolyData()
+        self._path_polydata.SetPoints(self._path_points)
+        self._path_polydata.SetLines(self._path_lines)
+        
+        path_tube = vtk.vtkTubeFilter()
+        path_tube.SetInputData(self._path_polydata)
+        path_tube.SetRadius(0.5)
+        path_tube.SetNumberOfSides(12)
+        
+        path_mapper = vtk.vtkPolyDataMapper()
+        path_mapper.SetInputConnection(path_tube.GetOutputPort())
+        
+        self.path_line_actor = vtk.vtkActor()
+        self.path_line_actor.SetMapper(path_mapper)
+        self.path_line_actor.GetProperty().SetColor(0.0, 1.0, 1.0)
+        self.path_line_actor.GetProperty().SetOpacity(0.6)
         self.picker = None
         self.picker_observer = None
         
         self.setup_picker()
     
     def setup_picker(self):
-        self.picker = vtk.vtkCellPicker()
-        self.picker.SetTolerance(0.005)
+        # The hardware picker reads the z-buffer (VTK 9.1+), so a pick costs
+        # the same on any mesh; the cell picker walks the triangles on the CPU
+        if hasattr(vtk, 'vtkHardwarePicker'):
+            self.picker = vtk.vtkHardwarePicker()
+        else:
+            self.picker = vtk.vtkCellPicker()
+            self.picker.SetTolerance(0.005)
     
     def enable_picking_mode(self, interactor):
         self.is_picking_mode = True
@@ -114,27 +148,19 @@ class FlythroughManager:
             return
         
         click_pos = obj.GetEventPosition()
-        self.picker.Pick(click_pos[0], click_pos[1], 0, self.renderer)
+        picked = self.picker.Pick(click_pos[0], click_pos[1], 0, self.renderer)
         picked_pos = self.picker.GetPickPosition()
         
-        if self.picker.GetCellId() >= 0:
+        if picked:
             self.add_manual_point(picked_pos)
             print(f"✓ Point {len(self.manual_points)} picked at: {picked_pos}")
     
     def add_manual_point(self, position):
         self.manual_points.append(position)
         
-        sphere = vtk.vtkSphereSource()
-        sphere.SetCenter(position)
-        sphere.SetRadius(2.0)
-        sphere.SetThetaResolution(16)
-        sphere.SetPhiResolution(16)
-        
-        mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputConnection(sphere.GetOutputPort())
-        
         actor = vtk.vtkActor()
-        actor.SetMapper(mapper)
+        actor.SetMapper(self._sphere_mapper)
+        actor.SetPosition(position)
         actor.GetProperty().SetColor(1.0, 0.0, 1.0)
         actor.GetProperty().SetOpacity(0.8)
         
@@ -147,52 +173,34 @@ class FlythroughManager:
             render_window.Render()
     
     def update_path_line(self):
-        if self.path_line_actor:
-            self.renderer.RemoveActor(self.path_line_actor)
-            self.path_line_actor = None
-        
-        if len(self.manual_points) < 2:
+        """Append picked points not yet in the path line; the actor is reused"""
+        start = self._path_points.GetNumberOfPoints()
+        if start == len(self.manual_points):
             return
         
-        points = vtk.vtkPoints()
-        for pos in self.manual_points:
-            points.InsertNextPoint(pos)
-        
-        lines = vtk.vtkCellArray()
-        for i in range(len(self.manual_points) - 1):
-            line = vtk.vtkLine()
-            line.GetPointIds().SetId(0, i)
-            line.GetPointIds().SetId(1, i + 1)
-            lines.InsertNextCell(line)
-        
-        polydata = vtk.vtkPolyData()
-        polydata.SetPoints(points)
-        polydata.SetLines(lines)
-        
-        tube = vtk.vtkTubeFilter()
-        tube.SetInputData(polydata)
-        tube.SetRadius(0.5)
-        tube.SetNumberOfSides(12)
-        tube.Update()
+        for i in range(start, len(self.manual_points)):
+            self._path_points.InsertNextPoint(self.manual_points[i])
+            if i > 0:
+                self._path_lines.InsertNextCell(2)
+                self._path_lines.InsertCellPoint(i - 1)
+                self._path_lines.InsertCellPoint(i)
         
-        mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputConnection(tube.GetOutputPort())
+        self._path_points.Modified()
+        self._path_lines.Modified()
+        self._path_polydata.Modified()
         
-        self.path_line_actor = vtk.vtkActor()
-        self.path_line_actor.SetMapper(mapper)
-        self.path_line_actor.GetProperty().SetColor(0.0, 1.0, 1.0)
-        self.path_line_actor.GetProperty().SetOpacity(0.6)
-        
-        self.renderer.AddActor(self.path_line_actor)
+        if len(self.manual_points) >= 2 and not self.renderer.HasViewProp(self.path_line_actor):
+            self.renderer.AddActor(self.path_line_actor)
     
     def clear_manual_points(self):
         for actor in self.point_sphere_actors:
             self.renderer.RemoveActor(actor)
         self.point_sphere_actors.clear()
         
-        if self.path_line_actor:
-            self.renderer.RemoveActor(self.path_line_actor)
-            self.path_line_actor = None
+        self.renderer.RemoveActor(self.path_line_actor)
+        self._path_points.Reset()
+        self._path_lines.Reset()
+        self._path_polydata.Modified()
         
         self.manual_points.clear()
         print("Manual path cleared")
@@ -244,8 +252,6 @@ class FlythroughManager:
         if not self.flythrough_path:
             return False
         
-        self.flythrough_timer = QTimer()
-        self.flythrough_timer.timeout.connect(self.update_flythrough)
         interval = int(50 / speed)
         self.flythrough_timer.start(interval)
         
@@ -261,8 +267,6 @@ class FlythroughManager:
         if not self.flythrough_path:
             return False
         
-        self.flythrough_timer = QTimer()
-        self.flythrough_timer.timeout.connect(self.update_flythrough)
         interval = int(50 / speed)
         self.flythrough_timer.start(interval)
         return True
@@ -359,18 +363,16 @@ class FlythroughManager:
         self.flythrough_index += 1
     
     def stop_flythrough(self):
-        if self.flythrough_timer:
-            self.flythrough_timer.stop()
-            self.flythrough_timer = None
+        self.flythrough_timer.stop()
         self.flythrough_index = 0
         self.flythrough_path = []
     
     def is_running(self):
-        return self.flythrough_timer is not None
+        return self.flythrough_timer.isActive()
     
     def set_speed(self, speed):
         self.speed = speed
-        if self.flythrough_timer and self.flythrough_timer.isActive():
+        if self.flythrough_timer.isActive():
             interval = int(50 / speed)
             self.flythrough_timer.setInterval(interval)
     
@@ -389,7 +391,9 @@ class VirtualEndoscopyManager:
     def __init__(self, renderer, model_loader):
         self.renderer = renderer
         self.model_loader = model_loader
-        self.flythrough_timer = None
+        # One timer for every run: started and stopped, never recreated
+        self.flythrough_timer = QTimer()
+        self.flythrough_timer.timeout.connect(self.update_camera)
         self.camera_path = []
         self.current_index = 0
         self.speed = 1.0
@@ -483,29 +487,20 @@ class VirtualEndoscopyManager:
         
         smoothed = self.smooth_path(centerline_points, window=7)
         
+        # Transform the whole path to world space once, outside the loop
         if self.model_loader.ct_image:
-            spacing = self.model_loader.ct_image.GetSpacing()
-            origin = self.model_loader.ct_image.GetOrigin()
+            spacing = np.asarray(self.model_loader.ct_image.GetSpacing(), dtype=float)
+            origin = np.asarray(self.model_loader.ct_image.GetOrigin(), dtype=float)
+            pts_world = smoothed * spacing + origin
         else:
-            spacing = (1.0, 1.0, 1.0)
-            origin = (0.0, 0.0, 0.0)
+            pts_world = np.asarray(smoothed, dtype=float)
         
         camera_path = []
-        for i in range(len(smoothed) - 5):
-            pos = smoothed[i]
-            pos_world = (
-                pos[0] * spacing[0] + origin[0],
-                pos[1] * spacing[1] + origin[1],
-                pos[2] * spacing[2] + origin[2]
-            )
-            look_ahead_idx = min(i + 5, len(smoothed) - 1)
-            focal = smoothed[look_ahead_idx]
-            focal_world = (
-                focal[0] * spacing[0] + origin[0],
-                focal[1] * spacing[1] + origin[1],
-                focal[2] * spacing[2] + origin[2]
-            )
-            camera_path.append({'position': pos_world, 'focal_point': focal_world})
+        last = len(pts_world) - 1
+        for i in range(len(pts_world) - 5):
+            look_ahead_idx = min(i + 5, last)
+            camera_path.append({'position': tuple(pts_world[i]),
+                                'focal_point': tuple(pts_world[look_ahead_idx])})
         
         return camera_path
     
@@ -527,8 +522,6 @@ class VirtualEndoscopyManager:
         self.speed = speed
         self.is_active = True
         
-        self.flythrough_timer = QTimer()
-        self.flythrough_timer.timeout.connect(self.update_camera)
         interval = int(50 / speed)
         self.flythrough_timer.start(interval)
         return True
@@ -555,9 +548,7 @@ class VirtualEndoscopyManager:
         self.current_index += 1
     
     def stop_flythrough(self):
-        if self.flythrough_timer:
-            self.flythrough_timer.stop()
-            self.flythrough_timer = None
+        self.flythrough_timer.stop()
         self.current_index = 0
         self.camera_path = []
         self.is_active = False
@@ -567,6 +558,6 @@ class VirtualEndoscopyManager:
     
     def set_speed(self, speed):
         self.speed = speed
-        if self.flythrough_timer and self.flythrough_timer.isActive():
+        if self.flythrough_timer.isActive():
             interval = int(50 / speed)
             self.flythrough_timer.setInterval(interval)
\ No newline at end of file
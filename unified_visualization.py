@@ -34,11 +34,18 @@ class ClippingManager:
         self.enabled_x = False
         self.enabled_y = False
         self.enabled_z = False
+        self._applied_planes = None  # Enabled axes currently in the collection
+        
+        # One plane collection shared by every mapper: toggling a plane
+        # edits this collection instead of each part's mapper
+        self.clipping_planes = vtk.vtkPlaneCollection()
         
         self.update_plane_origins(50, 50, 50)
     
     def set_actors(self, actors):
         self.actors = actors
+        for actor in self.actors.values():
+            actor.GetMapper().SetClippingPlanes(self.clipping_planes)
     
     def set_scene_bounds(self, bounds):
         if bounds:
@@ -89,21 +96,24 @@ class ClippingManager:
         if not self.actors:
             return
         
-        for actor in self.actors.values():
-            mapper = actor.GetMapper()
-            mapper.RemoveAllClippingPlanes()
-            
-            if self.enabled_x:
-                mapper.AddClippingPlane(self.plane_x)
-            if self.enabled_y:
-                mapper.AddClippingPlane(self.plane_y)
-            if self.enabled_z:
-                mapper.AddClippingPlane(self.plane_z)
+        # The mappers hold the plane objects themselves, so a moved origin
+        # shows up on the next render; only a changed plane set needs work
+        planes = (self.enabled_x, self.enabled_y, self.enabled_z)
+        if planes == self._applied_planes:
+            return
+        self._applied_planes = planes
+        
+        self.clipping_planes.RemoveAllItems()
+        if self.enabled_x:
+            self.clipping_planes.AddItem(self.plane_x)
+        if self.enabled_y:
+            self.clipping_planes.AddItem(self.plane_y)
+        if self.enabled_z:
+            self.clipping_planes.AddItem(self.plane_z)
     
     def remove_all_clipping(self):
-        for actor in self.actors.values():
-            mapper = actor.GetMapper()
-            mapper.RemoveAllClippingPlanes()
+        self._applied_planes = None
+        self.clipping_planes.RemoveAllItems()
 
 # ========== INTERACTIVE MPR MANAGER (NEW!) ==========
 
@@ -227,6 +237,12 @@ class InteractiveMPRManager:
         self.planeWidgetZ.On()
         self.planeWidgetZ.SetEnabled(False)
         
+        # Each widget reslices into one reusable 2D buffer per slider move
+        for widget in (self.planeWidgetX, self.planeWidgetY, self.planeWidgetZ):
+            reslice = widget.GetReslice()
+            reslice.SetOutputDimensionality(2)
+            reslice.AutoCropOutputOff()
+        
         print("[MPRManager] ✅ Plane widgets created with texture mapping")
     
     def update_plane_state(self, axis, enabled, position_percent):
@@ -267,6 +283,26 @@ class InteractiveMPRManager:
             if enabled:
                 self.planeWidgetZ.GetTexturePlaneProperty().SetOpacity(1.0)
     
+    def set_slab_mode(self, mode='mean', number_of_slices=1):
+        """
+        Set thick-slab rendering for all planes.
+        
+        Args:
+            mode: 'max' (MIP), 'min' or 'mean'
+            number_of_slices: Slab thickness in slices (1 = thin slice)
+        """
+        for widget in (self.planeWidgetX, self.planeWidgetY, self.planeWidgetZ):
+            if not widget:
+                continue
+            reslice = widget.GetReslice()
+            if mode == 'max':
+                reslice.SetSlabModeToMax()
+            elif mode == 'min':
+                reslice.SetSlabModeToMin()
+            else:
+                reslice.SetSlabModeToMean()
+            reslice.SetSlabNumberOfSlices(number_of_slices)
+    
     def set_window_level(self, window, level):
         """Set window/level for all planes"""
         if self.planeWidgetX: